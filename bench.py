@@ -0,0 +1,346 @@
+""" Benchmarks of the solvers: each day is solved several times, with its output silenced,
+to report statistics of the timings of each stage"""
+
+import argparse
+import contextlib
+import math
+import os
+import pathlib
+import statistics
+import sys
+import tracemalloc
+
+import corpus
+import generate
+import lib
+import run
+
+# How much the fitted exponents may exceed the expected ones before being flagged
+GROWTH_TOLERANCE = 0.25
+# Stages faster than this are mostly overhead: their growth is not fitted
+MIN_FITTED_TIME = 1e-3
+# Seconds each part may take, so that one that would not end (e.g. day 11's reference
+# part 2) is cancelled. A day with a cancelled part is only run once
+TIME_BUDGET = 10.0
+
+
+def solve_silently(
+    day: int,
+    source=None,
+    parse_cache: bool = False,
+    metrics: bool = False,
+    engine: str = "reference",
+) -> lib.Solver:
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        solver = lib.DAYS.engines(day)[engine](day, source=source)
+        solver.RESULT_POLICY = lib.ResultPolicy.VERIFY
+        solver.MEMOIZE = False
+        solver.PARSE_CACHE = parse_cache
+        solver.METRICS = metrics
+        solver.PROGRESS = False
+        solver.CHECKPOINT_INTERVAL = None
+        solver.TIME_BUDGET = TIME_BUDGET
+        solver()
+
+    return solver
+
+
+def benchmark_day(
+    day: int,
+    runs: int = 10,
+    warmup: int = 2,
+    filename: pathlib.Path | None = None,
+    parse_cache: bool = False,
+    engine: str = "reference",
+) -> dict[str, list[float]]:
+    """Returns the timings of each stage over `runs` runs, after `warmup` ones. The
+    input is read once, so that the runs do not time reading it from disk. Parts
+    cancelled by their budget are left out, and end the runs"""
+    if filename is None:
+        filename = lib.INPUTS / f"day_{day:02}.txt"
+    with lib.open_maybe_compressed(filename) as f:
+        source = lib.as_input(f.read())
+
+    timings = {stage: [] for stage in lib.Solver.STAGES}
+    for run in range(warmup + runs):
+        solver = solve_silently(day, source, parse_cache, engine=engine)
+        if run >= warmup or solver.timeouts:
+            for stage, t in solver.timings.items():
+                if t is not None and stage not in solver.timeouts:
+                    timings[stage].append(t)
+
+        if solver.timeouts:  # Each further run would only wait for the budget again
+            break
+
+    return timings
+
+
+def print_stats(day: int, timings: dict[str, list[float]]):
+    for stage, values in timings.items():
+        if not values:
+            continue
+
+        print(
+            f"{day:3} {stage:>6}",
+            f"{min(values):9.4f}s",
+            f"{statistics.median(values):9.4f}s",
+            f"{lib.percentile(values, 95):9.4f}s",
+        )
+
+
+def peak_memory(day: int, filename: pathlib.Path | None = None) -> int:
+    """Peak memory (traced by Python) of a run"""
+    tracemalloc.start()
+    try:
+        solve_silently(day, filename)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def growth_exponent(sizes: list[float], values: list[float]) -> float:
+    """Slope of the least squares fit of log(values) against log(sizes)"""
+    xs = [math.log(s) for s in sizes]
+    ys = [math.log(v) for v in values]
+    return statistics.linear_regression(xs, ys).slope
+
+
+def complexity(
+    day: int, scales: list[float], runs: int = 3, seed: int = 0
+) -> dict[str, tuple[float | None, float]]:
+    """Fits the growth of each stage (and of the peak memory) over generated inputs of
+    increasing scale. Returns the fitted and the expected exponents.
+
+    The growth is fitted against the scale, which the generators keep proportional
+    to the number of records, rather than the file size: some inputs have a fixed
+    part (e.g. day 5's rules) that does not grow with the work"""
+    sizes = []
+    medians = {stage: [] for stage in lib.Solver.STAGES}
+    peaks = []
+
+    for scale in scales:
+        path = generate.write(day, scale, seed)
+        sizes.append(scale)
+
+        for stage, values in benchmark_day(day, runs, 1, path).items():
+            medians[stage].append(statistics.median(values) if values else 0.0)
+
+        peaks.append(peak_memory(day, path))
+        print(f"  x{scale:<6g} {path.stat().st_size:>12} bytes", file=sys.stderr)
+
+    expected = lib.DAYS[day].EXPECTED_GROWTH
+    growth = {}
+    for stage, values in medians.items():
+        fitted = None
+        if min(values) >= MIN_FITTED_TIME:
+            fitted = growth_exponent(sizes, values)
+        growth[stage] = (fitted, expected.get(stage, 1.0))
+
+    growth["memory"] = (growth_exponent(sizes, peaks), expected.get("memory", 1.0))
+
+    return growth
+
+
+def print_complexity(day: int, growth: dict[str, tuple[float | None, float]]) -> bool:
+    """Returns False if any growth is worse than expected"""
+    as_expected = True
+
+    for stage, (fitted, expected) in growth.items():
+        if fitted is None:
+            print(f"{day:3} {stage:>6} {'-':>8} {expected:8.2f}  (too fast to fit)")
+            continue
+
+        flag = ""
+        if fitted > expected + GROWTH_TOLERANCE:
+            flag = "  WORSE THAN EXPECTED"
+            as_expected = False
+
+        print(f"{day:3} {stage:>6} {fitted:8.2f} {expected:8.2f}{flag}")
+
+    return as_expected
+
+
+def differential(day: int, inputs: list[pathlib.Path], runs: int = 3) -> bool:
+    """Solves each input with every engine of the day, checking their results against
+    the reference engine's, and prints their median total times and speedups over the
+    reference. Returns False if any result does not match"""
+    engines = lib.DAYS.engines(day)
+    if len(engines) == 1:
+        print(f"{day:3} Only a reference engine")
+        return True
+
+    as_expected = True
+    for path in inputs:
+        totals, results, cancelled = {}, {}, set()
+        for name in engines:
+            solver = solve_silently(day, path, engine=name)  # Also a warmup
+            results[name] = solver.result_1, solver.result_2
+            if solver.timeouts:
+                cancelled.add(name)
+
+            timings = benchmark_day(day, runs, 0, path, engine=name)
+            totals[name] = sum(statistics.median(v) for v in timings.values() if v)
+
+        for name in engines:
+            mismatches = [
+                f"part {part}: {result!r} != {reference!r}"
+                for part, (result, reference) in enumerate(
+                    zip(results[name], results["reference"]), 1
+                )
+                # Unless the reference did not resolve it (e.g. cancelled by its budget)
+                if reference is not None and result != reference
+            ]
+            as_expected &= not mismatches
+
+            # Against a reference cut short by its budget, speedups mean nothing
+            speedup = "n/a"
+            if not cancelled & {name, "reference"}:
+                speedup = f"{totals['reference'] / totals[name]:.2f}x"
+
+            print(
+                f"{day:3} {path.name:<24} {name:<12} {totals[name]:9.4f}s",
+                f"{speedup:>9}",
+                "MISMATCH " + ", ".join(mismatches) if mismatches else "",
+            )
+
+    return as_expected
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the AoC 2024 solvers")
+    parser.add_argument(
+        "--days", type=run.parse_days, help="Days to benchmark (default: all available)"
+    )
+    parser.add_argument("-n", "--runs", type=int, default=10, help="Timed runs per day")
+    parser.add_argument("--warmup", type=int, default=2, help="Untimed runs per day")
+    parser.add_argument(
+        "--input", type=pathlib.Path, help="Alternative input (only for a single day)"
+    )
+    parser.add_argument(
+        "--cpu", type=int, help="Pin the process to this CPU (where supported)"
+    )
+    parser.add_argument(
+        "--parse-cache", action="store_true", help="Use the parsed input cache"
+    )
+    parser.add_argument(
+        "--complexity",
+        action="store_true",
+        help="Fit how each stage grows over generated inputs of increasing scale",
+    )
+    parser.add_argument(
+        "--scales",
+        type=lambda spec: [float(x) for x in spec.split(",")],
+        default=[1, 2, 4, 8],
+        help="Scales of the generated inputs for --complexity (default: 1,2,4,8)",
+    )
+    parser.add_argument(
+        "--engines",
+        action="store_true",
+        help="Check every engine of the days against their reference engine, over "
+        "--corpus, --input or generated inputs (at --scales), with their speedups",
+    )
+    parser.add_argument(
+        "--corpus", help="Inputs for --engines: a directory or a glob (see corpus.py)"
+    )
+    parser.add_argument(
+        "--compare",
+        type=float,
+        metavar="PCT",
+        help="Fail if any median is more than PCT%% slower than in the previous runs",
+    )
+    parser.add_argument(
+        "--metrics",
+        action="store_true",
+        help="Also print the solvers' counters (from an extra run)",
+    )
+    args = parser.parse_args()
+
+    lib.configure_tracing("WARNING")  # Traces would be timed too
+
+    days = args.days or run.available_days()
+
+    if args.input is not None and len(days) != 1:
+        parser.error("--input needs a single day in --days")
+
+    if args.cpu is not None:
+        try:
+            os.sched_setaffinity(0, {args.cpu})
+        except AttributeError:
+            print("CPU pinning is not supported on this platform", file=sys.stderr)
+
+    if args.engines:
+        print(f"{'Day':>3} {'Input':<24} {'Engine':<12} {'Median':>10} {'Speedup':>8}")
+        as_expected = True
+        for day in days:
+            if args.corpus is not None:
+                inputs = corpus.find_inputs(args.corpus)
+            elif args.input is not None:
+                inputs = [args.input]
+            else:
+                inputs = [generate.write(day, scale) for scale in args.scales]
+
+            try:
+                as_expected &= differential(day, inputs, args.runs)
+            except Exception as e:
+                print(f"{day:3} {type(e).__name__}: {e}")
+                as_expected = False
+
+        if not as_expected:
+            sys.exit(1)
+        return
+
+    if args.complexity:
+        print(f"{'Day':>3} {'Stage':>6} {'Growth':>8} {'Expected':>8}")
+        as_expected = True
+        for day in days:
+            try:
+                growth = complexity(day, args.scales, args.runs, seed=0)
+            except Exception as e:
+                print(f"{day:3} {type(e).__name__}: {e}")
+                as_expected = False
+                continue
+
+            as_expected &= print_complexity(day, growth)
+
+        if not as_expected:
+            sys.exit(1)
+        return
+
+    print(f"{'Day':>3} {'Stage':>6} {'Min':>10} {'Median':>10} {'P95':>10}")
+    regressions = []
+    for day in days:
+        try:
+            timings = benchmark_day(
+                day, args.runs, args.warmup, args.input, args.parse_cache
+            )
+        except Exception as e:
+            print(f"{day:3} {type(e).__name__}: {e}")
+            continue
+
+        print_stats(day, timings)
+
+        if args.metrics:  # From an extra run, not to slow down the timed ones
+            solver = solve_silently(day, args.input, args.parse_cache, metrics=True)
+            for metric, value in solver.metrics.items():
+                print(f"{'':3} {metric:<32} {value:>12}")
+
+        medians = {
+            stage: statistics.median(values) if values else None
+            for stage, values in timings.items()
+        }
+        if args.input is None:  # Only the actual inputs are comparable over time
+            if args.compare is not None:
+                regressions += lib.TIMING_HISTORY.regressions(
+                    day, medians, args.compare / 100, source="bench"
+                )
+            lib.TIMING_HISTORY.append(day, medians, source="bench")
+
+    for regression in regressions:
+        print("Slower:", regression)
+
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+""" Runs a day's solver over a corpus of inputs (a directory or a glob), in a process
+pool. Each result is printed as a JSON line as soon as it is solved, and a summary of
+the throughput and latency percentiles ends the run (on stderr).
+"""
+
+import argparse
+import concurrent.futures
+import glob
+import json
+import os
+import pathlib
+import statistics
+import sys
+import time
+
+import lib
+import run
+
+# Fields of lib.SolveReport printed (stars only make sense for the stored input)
+REPORT_FIELDS = ("result_1", "result_2", "timings", "timeouts", "error")
+
+
+def find_inputs(spec: str) -> list[pathlib.Path]:
+    """The files in a directory, or the files matching a glob"""
+    if (path := pathlib.Path(spec)).is_dir():
+        return sorted(f for f in path.iterdir() if f.is_file())
+
+    return sorted(pathlib.Path(f) for f in glob.glob(spec, recursive=True))
+
+
+def warm_up(day: int):
+    """Pool worker initializer: imports the day up front"""
+    lib.configure_tracing("WARNING")
+    lib.DAYS[day]
+
+
+def solve_input(day: int, path: pathlib.Path, parts=(1, 2), **settings) -> dict:
+    t0 = time.perf_counter()
+    report = run.solve_day(day, False, parts, path, **settings)
+    latency = time.perf_counter() - t0
+
+    return {"input": str(path), "day": day, "latency": latency} | {
+        field: getattr(report, field) for field in REPORT_FIELDS
+    }
+
+
+def solve_corpus(
+    day: int, inputs: list[pathlib.Path], jobs: int = 1, parts=(1, 2), **settings
+):
+    """Yields the results of each input as they are solved"""
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=jobs, initializer=warm_up, initargs=(day,)
+    ) as pool:
+        futures = [
+            pool.submit(solve_input, day, path, parts, **settings) for path in inputs
+        ]
+        for future in concurrent.futures.as_completed(futures):
+            yield future.result()
+
+
+def print_summary(
+    latencies: list[float], n_errors: int, n_timeouts: int, elapsed: float
+):
+    print(
+        f"{len(latencies)} inputs in {elapsed:.3f}s:",
+        f"{len(latencies) / elapsed:.1f} inputs/s,",
+        f"{n_errors} errors, {n_timeouts} timed out",
+        file=sys.stderr,
+    )
+    print(
+        "Latency:",
+        f"mean {statistics.mean(latencies):.4f}s",
+        *(f"p{p} {lib.percentile(latencies, p):.4f}s" for p in (50, 90, 99)),
+        f"max {max(latencies):.4f}s",
+        file=sys.stderr,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run an AoC 2024 solver over a corpus of inputs"
+    )
+    parser.add_argument("day", type=int)
+    parser.add_argument(
+        "inputs", help="Directory of inputs, or glob (e.g. 'inputs/generated/day_07_*')"
+    )
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=0, help="Worker processes (0: one per CPU)"
+    )
+    parser.add_argument("--part", type=int, choices=(1, 2), help="Only solve this part")
+    parser.add_argument("--engine", default="reference", help="Solve with this engine")
+    parser.add_argument(
+        "--time-budget",
+        type=float,
+        metavar="SECONDS",
+        help="Cancel any part taking longer than this, reporting it as timed out",
+    )
+    args = parser.parse_args()
+
+    if args.day not in lib.DAYS:
+        parser.error(f"No solver for day {args.day}")
+    if not (inputs := find_inputs(args.inputs)):
+        parser.error(f"No inputs in {args.inputs}")
+
+    # Every input is actually solved, and only once
+    settings = {"MEMOIZE": False, "CHECKPOINT_INTERVAL": None, "engine": args.engine}
+    if args.time_budget is not None:
+        settings["TIME_BUDGET"] = args.time_budget
+    parts = (args.part,) if args.part else (1, 2)
+
+    t0 = time.perf_counter()
+    latencies = []
+    n_errors = n_timeouts = 0
+    for result in solve_corpus(
+        args.day, inputs, args.jobs or os.cpu_count(), parts, **settings
+    ):
+        print(json.dumps(result, default=str), flush=True)
+
+        latencies.append(result["latency"])
+        n_errors += result["error"] is not None
+        n_timeouts += bool(result["timeouts"])
+
+    print_summary(latencies, n_errors, n_timeouts, time.perf_counter() - t0)
+
+
+if __name__ == "__main__":
+    main()
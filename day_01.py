@@ -34,5 +34,6 @@ class Solver(lib.Solver):
         self.resolved(result_2=result_2)
 
 
-solver = Solver(DAY)
-solver()
+if __name__ == "__main__":
+    solver = Solver(DAY)
+    solver()
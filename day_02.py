@@ -58,5 +58,6 @@ class Solver(lib.Solver):
         return True
 
 
-solver = Solver(DAY)
-solver()
+if __name__ == "__main__":
+    solver = Solver(DAY)
+    solver()
@@ -56,5 +56,6 @@ class Solver(lib.Solver):
         self.resolved(result_1=result_1, result_2=result_2)
 
 
-solver = Solver(DAY)
-solver()
+if __name__ == "__main__":
+    solver = Solver(DAY)
+    solver()
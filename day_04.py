@@ -21,15 +21,15 @@ class Solver(lib.Solver):
 
         for x_pos in self.find_xmas_x():
 
-            self.printd()
-            self.printd("X___", x_pos, "+")
+            self.debug()
+            self.debug("X___", x_pos, "+")
 
             for m_pos, direction in self.find_xmas_m(x_pos):
-                self.printd("XM__", m_pos, direction)
+                self.debug("XM__", m_pos, direction)
                 if a_pos := self.is_xmas_a(m_pos, direction):
-                    self.printd("XMA_", a_pos, direction)
+                    self.debug("XMA_", a_pos, direction)
                     if s_pos := self.is_xmas_s(a_pos, direction):
-                        self.printd("XMAS", s_pos, direction, tick)
+                        self.debug("XMAS", s_pos, direction, tick)
                         n_xmas += 1
 
         self.resolved(result_1=n_xmas)
@@ -40,19 +40,19 @@ class Solver(lib.Solver):
 
         for m_pos in self.find_x_mas_m():
 
-            self.printd("M__", m_pos)
+            self.debug("M__", m_pos)
             for a_pos, direction in self.find_x_mas_a(m_pos):
-                self.printd("MA_", a_pos, direction)
+                self.debug("MA_", a_pos, direction)
                 if s_pos := self.is_x_mas_s(a_pos, direction):
-                    self.printd("MAS", s_pos, direction, tick)
+                    self.debug("MAS", s_pos, direction, tick)
                     mas_occurencies.append((m_pos, a_pos, s_pos))
 
         mas_occurencies.sort(key=lambda x: x[1])
         a_locations = collections.Counter(a_pos for _, a_pos, _ in mas_occurencies)
-        print(a_locations)
+        self.debug(a_locations)
         for a_location, count in a_locations.items():
             if count == 2:
-                self.printd(f"A is in two MAS in {a_location}")
+                self.debug("A is in two MAS in", a_location)
                 n_x_mas += 1
                 continue
             if count == 3:
@@ -134,5 +134,6 @@ class Solver(lib.Solver):
             return None
 
 
-solver = Solver(DAY)
-solver()
+if __name__ == "__main__":
+    solver = Solver(DAY)
+    solver()
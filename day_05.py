@@ -68,14 +68,14 @@ class Solver(lib.Solver):
         corrected_updates = 0
 
         for update in updates:
-            self.printd(f"Update: {update.pages}")
+            self.debug("Update:", update.pages)
             applicable_rules = collections.defaultdict(list)
 
             for rule in rules:
                 if rule.ref in update.pages and rule.predecesor in update.pages:
                     applicable_rules[rule.ref].append(rule)
 
-            self.printd(f"Applicable rules: {len(applicable_rules)=}")
+            self.debug("Applicable rules:", len(applicable_rules))
 
             if self.verify_update(update, applicable_rules):
                 valid_updates += update.mid
@@ -128,8 +128,8 @@ class Solver(lib.Solver):
                         rule.predecesor in update.pages
                         and rule.predecesor not in corrected_pages
                     ):
-                        self.printd(
-                            f"Page {page:2d}. Awaiting: {rule.predecesor=} not added yet"
+                        self.debug(
+                            "Page", page, "awaiting", rule.predecesor, "not added yet"
                         )
                         all_rules_fulfilled = False
                         break
@@ -144,5 +144,6 @@ class Solver(lib.Solver):
         return ManualUpdate(corrected_pages).mid
 
 
-solver = Solver(DAY)
-solver()
+if __name__ == "__main__":
+    solver = Solver(DAY)
+    solver()
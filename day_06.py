@@ -31,16 +31,21 @@ class Solver(lib.Solver):
         Symbol.LOOP_OPTION: colorama.Fore.YELLOW,
     }
 
-    _D_ORDER = lib.DirectionYX.cycle(order="CW")
-    _D_ITER = lib.DirectionYX.cycle(start=GUARD_DIRECTION_START, order="CW")
+    def __init__(self, day_of_month, **kwargs):
+        super().__init__(day_of_month, **kwargs)
+        # Per solver, so that each solve starts from the guard's first direction
+        self._d_order = lib.DirectionYX.cycle(order="CW")
+        self._d_iter = lib.DirectionYX.cycle(
+            start=self.GUARD_DIRECTION_START, order="CW"
+        )
 
     def next_direction(self, d=None):
         if d is None:
-            return next(self._D_ITER)
+            return next(self._d_iter)
 
-        while next(self._D_ORDER) != d:
+        while next(self._d_order) != d:
             pass
-        return next(self._D_ORDER)
+        return next(self._d_order)
 
     def load_maze(self) -> lib.Maze:
         maze = lib.Maze(idx_symbol=self.Symbol.WALL, register_symbol=self.Symbol.GUARD)
@@ -53,7 +58,7 @@ class Solver(lib.Solver):
 
         return maze
 
-    def guard_pos_init(self, maze: Maze):
+    def guard_pos_init(self, maze: lib.Maze):
         pos = maze.registry[self.Symbol.GUARD]
 
         if not pos:
@@ -77,13 +82,19 @@ class Solver(lib.Solver):
 
         loop_options = set()
 
+        if (state := self.resume("guard")) is not None:
+            guard_pos, guard_direction, visited_pos, loop_options = state
+            # Get the directions back in step with the resumed guard
+            while self.next_direction() != guard_direction:
+                pass
+
+        budgeted = self.budgeted
+
         while guard_pos in maze:
-            maze.print(
-                replace={
-                    guard_pos: self.Symbol.GUARD,
-                }
-            )
-            print(guard_pos, guard_direction)
+            if budgeted:
+                self.check_budget(f"{len(visited_pos)} positions visited")
+            self.debug(lib.Lazy(maze.render, replace={guard_pos: self.Symbol.GUARD}))
+            self.debug(guard_pos, guard_direction)
             walked, some_loop_options = self.analyse_line(
                 maze, p0=guard_pos, d=guard_direction, previously_walked=visited_pos
             )
@@ -99,15 +110,22 @@ class Solver(lib.Solver):
 
             guard_direction = self.next_direction()
 
-        print(sorted(visited_pos))
-        maze.print(
-            replace={p: "X" for p in visited_pos} | {p: "O" for p in loop_options}
+            self.checkpoint(
+                "guard", lambda: (guard_pos, guard_direction, visited_pos, loop_options)
+            )
+
+        self.debug(lib.Lazy(sorted, visited_pos))
+        self.info(
+            lib.Lazy(
+                maze.render,
+                replace={p: "X" for p in visited_pos} | {p: "O" for p in loop_options},
+            )
         )
         self.resolved(result_1=len(visited_pos) - 1, result_2=len(loop_options))
 
     def analyse_line(
         self,
-        maze: Maze,
+        maze: lib.Maze,
         p0: lib.Position2D,
         d: lib.DirectionYX,
         previously_walked: dict[lib.Position2D, list[lib.DirectionYX]] = None,
@@ -154,8 +172,12 @@ class Solver(lib.Solver):
             walked.append(p_next)
             p = p_next
 
+        self.count("steps walked", len(walked))
+        self.count("loop options found", len(obstacle_loop_option))
+
         return walked, obstacle_loop_option
 
 
-solver = Solver(DAY)
-solver()
+if __name__ == "__main__":
+    solver = Solver(DAY)
+    solver()
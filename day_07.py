@@ -2,8 +2,8 @@
 
 import collections
 import dataclasses
-import datetime
 import itertools
+import logging
 from typing import override
 
 import lib
@@ -20,32 +20,44 @@ class CalibrationEquation:
 class Solver(lib.Solver):
     """https://adventofcode.com/2024/day/7"""
 
-    @override
-    def solve(self) -> None:
+    def __init__(self, day_of_month, **kwargs):
+        super().__init__(day_of_month, **kwargs)
+        # Indices of the equations resolved in part 1, which part 2 does not search again
+        self.resolvable_without_concat = None  # type: set[int] | None
 
-        equations = self.load_equations()
+    @override
+    def parse(self) -> list[CalibrationEquation]:
+        return self.load_equations()
 
-        sum_test_values = 0
-        sum_test_values_with_concat = 0
+    @override
+    def part_1(self, equations: list[CalibrationEquation]) -> int:
+        self.resolvable_without_concat = set()
 
-        for equation in equations:
-            if self.DEBUG or True:
-                print(datetime.datetime.now(), "Equation:", equation)
+        for i, equation in enumerate(self.progress(equations)):
+            self.debug("Equation:", equation)
 
             if self.equation_can_be_resolved(equation):
-                sum_test_values += equation.test_value
-                sum_test_values_with_concat += equation.test_value
+                self.resolvable_without_concat.add(i)
+
+                self.debug("Equation resolved:", equation)
+
+        return sum(equations[i].test_value for i in self.resolvable_without_concat)
 
-                if self.DEBUG:
-                    print("Equation resolved:", equation)
+    @override
+    def part_2(self, equations: list[CalibrationEquation]) -> int:
+        already_resolved = self.resolvable_without_concat or set()
+        sum_test_values_with_concat = sum(equations[i].test_value for i in already_resolved)
+
+        for i, equation in enumerate(self.progress(equations)):
+            if i in already_resolved:
+                continue
 
-            elif self.equation_can_be_resolved(equation, allow_concat=True):
+            if self.equation_can_be_resolved(equation, allow_concat=True):
                 sum_test_values_with_concat += equation.test_value
 
-                if self.DEBUG:
-                    print("Equation resolved (concat):", equation)
+                self.debug("Equation resolved (concat):", equation)
 
-        self.resolved(result_1=sum_test_values, result_2=sum_test_values_with_concat)
+        return sum_test_values_with_concat
 
     def load_equations(self) -> list[CalibrationEquation]:
         equations = []
@@ -67,11 +79,18 @@ class Solver(lib.Solver):
 
         q.append((0, equation.test_value, q_operands.popleft(), q_operands))
 
+        metrics = self.METRICS
+        tracing = self.tracer.isEnabledFor(logging.DEBUG)
+
         while q:
+            if metrics:
+                self.count("nodes expanded")
+                self.gauge("peak queue length", len(q))
+
             it, test_value, acc, q_operands = q.popleft()
 
-            if self.DEBUG:
-                print(
+            if tracing:
+                self.debug(
                     "It",
                     it,
                     "Test value:",
@@ -81,7 +100,7 @@ class Solver(lib.Solver):
                     "Operands:",
                     q_operands,
                 )
-                print("Queue:", len(q))
+                self.debug("Queue:", len(q))
             if not q_operands:
                 if acc == test_value:
                     return True
@@ -103,5 +122,50 @@ class Solver(lib.Solver):
                 )
 
 
-solver = Solver(DAY)
-solver()
+class BackwardsSolver(Solver):
+    """Searches from the test value back to the first operand, undoing the operators:
+    most branches end early, as a product must divide the value and a concatenation
+    must be its last digits"""
+
+    ENGINE = "backwards"
+
+    @override
+    def equation_can_be_resolved(
+        self, equation: CalibrationEquation, allow_concat=False
+    ) -> bool:
+        operands = equation.operands
+        return self._can_be_reached(
+            equation.test_value, operands, len(operands) - 1, allow_concat
+        )
+
+    @classmethod
+    def _can_be_reached(
+        cls, value: int, operands: list[int], i: int, allow_concat: bool
+    ) -> bool:
+        operand = operands[i]
+        if i == 0:
+            return value == operand
+
+        if value >= operand and cls._can_be_reached(
+            value - operand, operands, i - 1, allow_concat
+        ):
+            return True
+
+        if operand and value % operand == 0 and cls._can_be_reached(
+            value // operand, operands, i - 1, allow_concat
+        ):
+            return True
+
+        if allow_concat:
+            magnitude = 10 ** len(str(operand))
+            if value % magnitude == operand and cls._can_be_reached(
+                value // magnitude, operands, i - 1, allow_concat
+            ):
+                return True
+
+        return False
+
+
+if __name__ == "__main__":
+    solver = Solver(DAY)
+    solver()
@@ -1,6 +1,5 @@
 """ Solver for AoC 2024 Day 8"""
 
-import collections
 import enum
 import itertools
 from typing import override
@@ -13,39 +12,53 @@ DAY = int("8")
 class Solver(lib.Solver):
     """https://adventofcode.com/2024/day/8"""
 
+    # Every pair of antennas of each frequency is checked
+    EXPECTED_GROWTH = lib.Solver.EXPECTED_GROWTH | {
+        "part 1": 2.0,
+        "part 2": 2.0,
+        "memory": 2.0,
+    }
+
     class Symbol(enum.StrEnum):
         ANTENNA = "A"
         EMPTY = "."
         ANTI_NODE = "#"
 
     @override
-    def solve(self) -> None:
-
-        frequencies_and_locations = collections.defaultdict(set)
-
+    def parse(self) -> tuple[lib.Maze, dict[str, set[lib.Position2D]]]:
         maze = lib.Maze(register_symbol="ALL")
 
         maze.load_from_pos_symbol_generator(
             self.read_maze_to_coords(), ignore_symbol=self.Symbol.EMPTY
         )
 
-        for antenna_pos, freq in self.read_maze_to_coords(ignore_symbol="."):
-            frequencies_and_locations[freq].add(antenna_pos)
+        # Everything not empty is registered, i.e. the antennas by frequency
+        frequencies_and_locations = {
+            freq: set(locs) for freq, locs in maze.registry.items()
+        }
+
+        return maze, frequencies_and_locations
+
+    @override
+    def part_1(self, parsed) -> int:
+        maze, frequencies_and_locations = parsed
 
-        self.DEBUG = True
         antinodes_per_f = self.find_all_antinodes(frequencies_and_locations, maze)
 
-        if self.DEBUG:
-            for f, antinodes in antinodes_per_f.items():
-                print(
-                    f"Frequency {f} at locations {frequencies_and_locations[f]}: {antinodes}"
-                )
+        for f, antinodes in antinodes_per_f.items():
+            self.debug(
+                "Frequency", f, "at locations", frequencies_and_locations[f], antinodes
+            )
 
         antinodes = set(itertools.chain(*antinodes_per_f.values()))
 
-        maze.print(replace={x: self.Symbol.ANTI_NODE for x in antinodes})
+        self.info(lib.Lazy(maze.render, {x: self.Symbol.ANTI_NODE for x in antinodes}))
 
-        self.resolved(result_1=len(antinodes))
+        return len(antinodes)
+
+    @override
+    def part_2(self, parsed) -> int:
+        maze, frequencies_and_locations = parsed
 
         antinodes_per_f = self.find_all_antinodes(
             frequencies_and_locations, maze, multiple_harmonics=True
@@ -54,9 +67,9 @@ class Solver(lib.Solver):
 
         antinodes |= set(itertools.chain(*frequencies_and_locations.values()))
 
-        maze.print(replace={x: self.Symbol.ANTI_NODE for x in antinodes})
+        self.info(lib.Lazy(maze.render, {x: self.Symbol.ANTI_NODE for x in antinodes}))
 
-        self.resolved(result_2=len(antinodes))
+        return len(antinodes)
 
     def find_all_antinodes(
         self, frequencies_and_locations, maze: lib.Maze, multiple_harmonics=False
@@ -107,5 +120,6 @@ class Solver(lib.Solver):
         return set(antinodes)
 
 
-solver = Solver(DAY)
-solver()
+if __name__ == "__main__":
+    solver = Solver(DAY)
+    solver()
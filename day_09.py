@@ -2,6 +2,7 @@
 
 import collections
 import dataclasses
+import logging
 from typing import Optional, override
 
 import lib
@@ -35,27 +36,34 @@ class DiskNode:
 class Solver(lib.Solver):
     """https://adventofcode.com/2024/day/9"""
 
+    # Each file looks for space from the leftmost one
+    EXPECTED_GROWTH = lib.Solver.EXPECTED_GROWTH | {"part 2": 2.0}
+
     EMPTY = "."
 
     @override
-    def solve(self) -> None:
-
-        compressed_disk = list(self.read().strip())
+    def parse(self) -> list[int]:
+        return [int(c) for c in self.read().strip()]
 
+    @override
+    def part_1(self, compressed_disk: list[int]) -> int:
+        # Each part rearranges the disk in place, so each one needs its own
         disk_head, disk_tail = self.decompress_disk_into_dl_nodes(compressed_disk)
 
-        self.print_disk(disk_head)
+        self.debug(lib.Lazy(self.render_disk, disk_head))
 
         self.fragment(disk_head, disk_tail)
 
-        self.print_disk(disk_head)
+        self.debug(lib.Lazy(self.render_disk, disk_head))
 
-        self.resolved(result_1=self.checksum(disk_head))
+        return self.checksum(disk_head)
 
+    @override
+    def part_2(self, compressed_disk: list[int]) -> int:
         disk_head, disk_tail = self.decompress_disk_into_dl_nodes(compressed_disk)
         self.compact(disk_head, disk_tail)
 
-        self.resolved(result_2=self.checksum(disk_head))
+        return self.checksum(disk_head)
 
     def decompress_disk_into_dl_nodes(self, compressed_disk):
         disk_id = 0
@@ -66,9 +74,11 @@ class Solver(lib.Solver):
         tail = None
 
         order = 0
+        budgeted = self.budgeted
 
-        for c in compressed_disk:
-            size = int(c)
+        for size in compressed_disk:
+            if budgeted and order % 4096 == 0:
+                self.check_budget(f"{order} disk items")
 
             if not size:
                 is_space = not is_space
@@ -97,10 +107,16 @@ class Solver(lib.Solver):
         return head, tail
 
     def fragment(self, disk_head, disk_tail):
+        tracing = self.tracer.isEnabledFor(logging.DEBUG)
+        budgeted, n = self.budgeted, 0
 
         while disk_head != disk_tail:
-            if self.DEBUG:
-                self.print_disk(disk_head)
+            if budgeted:
+                n += 1
+                if n % 4096 == 0:
+                    self.check_budget(f"{n} steps")
+            if tracing:
+                self.debug(self.render_disk(disk_head))
 
             if isinstance(disk_head.disk_item, FilePart):
                 disk_head = disk_head.next
@@ -166,6 +182,8 @@ class Solver(lib.Solver):
         tail_iter = disk_tail
 
         last_empty_space = disk_head
+        tracing = self.tracer.isEnabledFor(logging.DEBUG)
+        budgeted, n = self.budgeted, 0
 
         while tail_iter is not None:
             if isinstance(tail_iter.disk_item, EmptySpace):
@@ -183,10 +201,16 @@ class Solver(lib.Solver):
                 if head_iter.order >= tail_iter.order:
                     break
 
-                if self.DEBUG:
-                    self.print_disk(disk_head, end="")
-                    print(
-                        f"Moving {tail_iter.disk_item.id_no} of size {moving_file_size} to {head_iter.disk_item.size}"
+                # Each file scans the disk for a space: checked here, not per file
+                if budgeted:
+                    n += 1
+                    if n % 4096 == 0:
+                        self.check_budget(f"{n} steps")
+
+                if tracing:
+                    self.debug(
+                        self.render_disk(disk_head)
+                        + f"Moving {tail_iter.disk_item.id_no} of size {moving_file_size} to {head_iter.disk_item.size}"
                     )
 
                 if isinstance(head_iter.disk_item, FilePart):
@@ -203,8 +227,8 @@ class Solver(lib.Solver):
                 head_iter = head_iter.next
                 spaces_skipped = True
 
-            if self.DEBUG:
-                self.print_disk(disk_head)
+            if tracing:
+                self.debug(self.render_disk(disk_head))
 
             tail_iter = tail_iter.prev
 
@@ -263,32 +287,31 @@ class Solver(lib.Solver):
             node.next.prev = node.prev
         del node
 
-    def print_disk(self, disk_head, end="\n"):
+    def render_disk(self, disk_head) -> str:
 
+        items = []
         node = disk_head
         while node is not None:
             if isinstance(node.disk_item, FilePart):
                 if node.disk_item.size == 1:
-                    print(node.disk_item.id_no, end="|")
+                    items.append(f"{node.disk_item.id_no}|")
                 else:
-                    print(
-                        node.disk_item.id_no,
-                        "_" * (node.disk_item.size - 1),
-                        sep="",
-                        end="|",
+                    items.append(
+                        f"{node.disk_item.id_no}{'_' * (node.disk_item.size - 1)}|"
                     )
 
             else:
-                print(self.EMPTY * node.disk_item.size, end="|")
+                items.append(self.EMPTY * node.disk_item.size + "|")
             node = node.next
 
-        print(end=end)
+        return "".join(items)
 
     def checksum(self, disk_head):
         acc = 0
         factor = -1
 
         node = disk_head
+        tracing = self.tracer.isEnabledFor(logging.DEBUG)
 
         while node is not None:
             for _ in range(node.disk_item.size):
@@ -299,13 +322,14 @@ class Solver(lib.Solver):
 
                 acc += node.disk_item.id_no * factor
 
-                if self.DEBUG:
-                    print(node.disk_item.id_no, factor, acc)
+                if tracing:
+                    self.debug(node.disk_item.id_no, factor, acc)
 
             node = node.next
 
         return acc
 
 
-solver = Solver(DAY)
-solver()
+if __name__ == "__main__":
+    solver = Solver(DAY)
+    solver()
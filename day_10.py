@@ -1,6 +1,7 @@
 """ Solver for AoC 2024 Day 10"""
 
 import enum
+import logging
 import queue
 from typing import override
 
@@ -17,12 +18,12 @@ class Solver(lib.Solver):
         PATH_END = 9
         
         
-    def __init__(self, day_of_month):
-        super().__init__(day_of_month)
+    def __init__(self, day_of_month, **kwargs):
+        super().__init__(day_of_month, **kwargs)
         self.maze = None
 
     @override
-    def solve(self) -> None:
+    def parse(self) -> list[lib.Position2D]:
 
         maze = lib.Maze(register_symbol=self.Symbol.PATH_START)
 
@@ -30,13 +31,17 @@ class Solver(lib.Solver):
         
         self.maze = maze
         
-        trailheads = maze.registry[self.Symbol.PATH_START]
+        return maze.registry[self.Symbol.PATH_START]
 
+    @override
+    def part_1(self, trailheads: list[lib.Position2D]) -> int:
         th_scores = {th: self._get_trailhead_score(th) for th in trailheads}        
-        self.resolved(result_1=sum(th_scores.values()))
-        
+        return sum(th_scores.values())
+
+    @override
+    def part_2(self, trailheads: list[lib.Position2D]) -> int:
         th_ratings = {th: self._get_trailhead_rating(th) for th in trailheads}        
-        self.resolved(result_2=sum(th_ratings.values()))
+        return sum(th_ratings.values())
         
         
     def _get_trailhead_score(self, trailhead: lib.Position2D) -> int:
@@ -49,7 +54,7 @@ class Solver(lib.Solver):
         
         score = 0
         
-        self.printd('Trailhead', trailhead)
+        self.debug('Trailhead', trailhead)
         
         if self.maze[trailhead] != self.Symbol.PATH_START:
             err_msg = f'Cannot start a path from point {trailhead} != {self.Symbol.PATH_START}'
@@ -62,13 +67,20 @@ class Solver(lib.Solver):
         
         q.put_nowait((trailhead, self.Symbol.PATH_START))
         
+        metrics = self.METRICS
+        tracing = self.tracer.isEnabledFor(logging.DEBUG)
+        
         while not q.empty():
             
+            if metrics:
+                self.count("nodes expanded")
+                self.gauge("peak queue length", q.qsize())
             
             step, height = q.get_nowait()
             
             
-            self.printd('Q', step, height)
+            if tracing:
+                self.debug('Q', step, height)
             
             if height == self.Symbol.PATH_END:
                 score += 1
@@ -88,15 +100,18 @@ class Solver(lib.Solver):
                 
                 if not repeat_path:
                     if new_step in visited:
-                        self.printd('Visited', new_step)
+                        if tracing:
+                            self.debug('Visited', new_step)
                         continue
                     visited.add(new_step)
                 
-                self.printd('New step', new_step)
+                if tracing:
+                    self.debug('New step', new_step)
                 
                 q.put_nowait((new_step, new_height))
                 
-            self.printd('Q', q.qsize())
+            if tracing:
+                self.debug('Q', q.qsize())
             
         
         
@@ -105,5 +120,6 @@ class Solver(lib.Solver):
         
 
 
-solver = Solver(DAY)
-solver()
+if __name__ == "__main__":
+    solver = Solver(DAY)
+    solver()
@@ -1,5 +1,6 @@
 """ Solver for AoC 2024 Day 11"""
 
+import collections
 import dataclasses
 from typing import override
 
@@ -13,7 +14,8 @@ class Stone:
     next: "Stone" = None
     prev: "Stone" = None
     
-    def blinked(self):
+    def blinked(self) -> "Stone | None":
+        """Blinks this stone, returning the next one to blink (not the split one)"""
         new_values = self.blink_change(self.value)
         
         self.value = new_values[0]
@@ -23,6 +25,7 @@ class Stone:
         
         aux = self.next
         self.next = Stone(new_values[1], prev=self, next=aux)
+        return aux
         
         
     @staticmethod
@@ -52,36 +55,65 @@ class Solver(lib.Solver):
     def solve(self) -> None:
         
         stones = self.load_stones()
+        blinks, result_1 = 0, None
+
+        if (state := self.resume("stones")) is not None:
+            blinks, result_1 = state["blinks"], state["result_1"]
+            stones = self.link_stones(state["values"])
         
-        for i in range(25):
+        for i in self.progress(range(blinks, 25), label="Blinks"):
             self.blink(stones)
-            print(f"After {i+1} blinks: {self._count_stones(stones)}")
-            if self.DEBUG:
-                self._print_stones(stones)
+            # Counting the stones walks all of them: only when tracing
+            self.debug(f"After {i+1} blinks:", lib.Lazy(self._count_stones, stones))
+            self.debug(lib.Lazy(self._render_stones, stones))
+            self.checkpoint_stones(stones, i + 1, result_1)
 
-        self.resolved(result_1=self._count_stones(stones))
+        if result_1 is None:
+            result_1 = self._count_stones(stones)
+        self.resolved(result_1=result_1)
         
         
         # FIXME this takes too long
-        for i in range(25, 50):
-            print(f"After {i+1} blinks: {self._count_stones(stones)}")
+        for i in self.progress(range(max(blinks, 25), 50), label="Blinks"):
             self.blink(stones)
-            if self.DEBUG:
-                self._print_stones(stones)
+            self.debug(f"After {i+1} blinks:", lib.Lazy(self._count_stones, stones))
+            self.debug(lib.Lazy(self._render_stones, stones))
+            self.checkpoint_stones(stones, i + 1, result_1)
         
         self.resolved(result_2=self._count_stones(stones))
 
+    def checkpoint_stones(self, stones: Stone, blinks: int, result_1: int | None):
+        # The values, as pickling the linked stones would recurse through all of them
+        self.checkpoint(
+            "stones",
+            lambda: {
+                "blinks": blinks,
+                "values": list(self._stone_values(stones)),
+                "result_1": result_1,
+            },
+        )
+
     def blink(self, head: Stone):
         current = head
+        budgeted, n = self.budgeted, 0
 
         while current:
-            current = current.blinked().next
+            current = current.blinked()
+
+            if budgeted:
+                n += 1
+                if n % 4096 == 0:
+                    self.check_budget()
         
     
     def load_stones(self) -> Stone:
         values = list(self.read_lines_typed(int))[0]
-        self.printd(values)
+        self.debug(values)
         
+        return self.link_stones(values)
+
+    @staticmethod
+    def link_stones(values: list[int]) -> Stone:
         head = current = Stone(values[0])
         
         for value in values[1:]:
@@ -100,11 +132,38 @@ class Solver(lib.Solver):
         return count
         
     @staticmethod
-    def _print_stones(stones):
+    def _stone_values(stones: Stone):
         while stones:
-            print(stones.value, end=" ")
+            yield stones.value
             stones = stones.next
-        print()
 
-solver = Solver(DAY)
-solver()
+    @classmethod
+    def _render_stones(cls, stones) -> str:
+        return " ".join(map(str, cls._stone_values(stones)))
+
+class CountsSolver(Solver):
+    """Blinks the number of stones of each value instead: stones of the same value
+    always change the same way, and their order does not change their number"""
+
+    ENGINE = "counts"
+
+    @override
+    def solve(self) -> None:
+        counts = collections.Counter(list(self.read_lines_typed(int))[0])
+
+        for i in self.progress(range(50), label="Blinks"):
+            blinked = collections.Counter()
+            for value, n in counts.items():
+                for new_value in Stone.blink_change(value):
+                    blinked[new_value] += n
+            counts = blinked
+
+            if i + 1 == 25:
+                self.resolved(result_1=counts.total())
+
+        self.resolved(result_2=counts.total())
+
+
+if __name__ == "__main__":
+    solver = Solver(DAY)
+    solver()
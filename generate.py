@@ -0,0 +1,325 @@
+""" Deterministic synthetic inputs, in the format of each day, at a configurable scale.
+
+A scale of 1 is roughly the size of an actual puzzle input: the number of records (lines,
+cells, files...) of the generated input grows linearly with it (grids grow in both
+dimensions).
+"""
+
+import argparse
+import math
+import pathlib
+import random
+import string
+import sys
+from typing import Callable
+
+import lib
+
+GENERATED = lib.INPUTS / "generated"
+
+GENERATORS = {}  # type: dict[int, Callable[[random.Random, float], str]]
+
+
+def generator(day: int):
+    def register(f: Callable[[random.Random, float], str]):
+        GENERATORS[day] = f
+        return f
+
+    return register
+
+
+def generate(day: int, scale: float = 1, seed: int = 0) -> str:
+    try:
+        f = GENERATORS[day]
+    except KeyError:
+        raise NotImplementedError(f"No generator for day {day}")
+
+    return f(random.Random(f"{day}-{seed}"), scale)
+
+
+def write(
+    day: int,
+    scale: float = 1,
+    seed: int = 0,
+    path: pathlib.Path | None = None,
+    compression: str = "",
+) -> pathlib.Path:
+    """Writes the input to `path`, compressed if its suffix is one of lib.CODECS. The
+    default path is under GENERATED, with the `compression` suffix (e.g. ".xz")"""
+    if path is None:
+        path = GENERATED / f"day_{day:02}_x{scale:g}_s{seed}.txt{compression}"
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with lib.open_maybe_compressed(path, "wt") as f:
+        f.write(generate(day, scale, seed))
+
+    return path
+
+
+def _scaled(n: int, scale: float) -> int:
+    return max(1, round(n * scale))
+
+
+def _side(n: int, scale: float) -> int:
+    """Side of a square grid, so that its area grows linearly with the scale"""
+    return max(2, round(n * math.sqrt(scale)))
+
+
+@generator(1)
+def location_lists(rng: random.Random, scale: float) -> str:
+    n = _scaled(1000, scale)
+    # Values from a pool smaller than the lists, so that they repeat across both, as
+    # part 2 counts
+    pool = [rng.randint(10000, 99999) for _ in range(max(1, n // 4))]
+
+    lines = []
+    for _ in range(n):
+        lines.append(f"{rng.choice(pool)}   {rng.choice(pool)}")
+
+    return "\n".join(lines) + "\n"
+
+
+@generator(2)
+def reports(rng: random.Random, scale: float) -> str:
+    lines = []
+    for _ in range(_scaled(1000, scale)):
+        levels = [rng.randint(1, 50)]
+        sign = rng.choice((-1, 1))
+        for _ in range(rng.randint(4, 7)):
+            levels.append(max(1, levels[-1] + sign * rng.randint(1, 3)))
+
+        if rng.random() < 0.5:  # Make it (likely) unsafe
+            i = rng.randrange(len(levels))
+            levels[i] = max(1, levels[i] + rng.choice((-5, -1, 0, 1, 5)))
+
+        lines.append(" ".join(map(str, levels)))
+
+    return "\n".join(lines) + "\n"
+
+
+@generator(3)
+def corrupted_memory(rng: random.Random, scale: float) -> str:
+    junk = string.ascii_letters + string.digits + string.punctuation + " "
+
+    def token() -> str:
+        roll = rng.random()
+        if roll < 0.3:
+            return f"mul({rng.randint(1, 999)},{rng.randint(1, 999)})"
+        if roll < 0.35:
+            return "do()"
+        if roll < 0.4:
+            return "don't()"
+        if roll < 0.5:
+            return rng.choice(("mul(", "mul[3,7]", "mul ( 2 , 4 )", "do(", "don't"))
+        return "".join(rng.choices(junk, k=rng.randint(1, 8)))
+
+    lines = []
+    for _ in range(_scaled(6, scale)):
+        line = ""
+        while len(line) < 3000:
+            line += token()
+        lines.append(line)
+
+    return "\n".join(lines) + "\n"
+
+
+@generator(4)
+def word_search(rng: random.Random, scale: float) -> str:
+    side = _side(140, scale)
+    return "".join(
+        "".join(rng.choices("XMAS", k=side)) + "\n" for _ in range(side)
+    )
+
+
+@generator(5)
+def print_queue(rng: random.Random, scale: float) -> str:
+    pages = rng.sample(range(10, 100), 49)  # In the order the rules enforce
+
+    rules = [
+        f"{a}|{b}" for i, a in enumerate(pages) for b in pages[i + 1 :]
+    ]
+    rng.shuffle(rules)
+
+    updates = []
+    for _ in range(_scaled(200, scale)):
+        update = rng.sample(pages, 2 * rng.randint(2, 11) + 1)
+        if rng.random() < 0.5:
+            update.sort(key=pages.index)
+        updates.append(",".join(map(str, update)))
+
+    return "\n".join(rules) + "\n\n" + "\n".join(updates) + "\n"
+
+
+def _guard_walk(grid: list[list[str]], x: int, y: int) -> int:
+    """Positions the guard visits, turning right at each obstacle, before leaving the
+    grid, or 0 if the guard never leaves or has to turn twice on the spot (as the day 6
+    solver expects a step between turns)"""
+    dx, dy = 0, -1
+    seen = set()
+    turned = False
+
+    while (x, y, dx, dy) not in seen:
+        seen.add((x, y, dx, dy))
+        nx, ny = x + dx, y + dy
+
+        if not (0 <= ny < len(grid) and 0 <= nx < len(grid[ny])):
+            return len({(px, py) for px, py, _, _ in seen})
+
+        if grid[ny][nx] == "#":
+            if turned:
+                return 0
+            dx, dy = -dy, dx
+            turned = True
+        else:
+            x, y = nx, ny
+            turned = False
+
+    return 0
+
+
+@generator(6)
+def guard_lab(rng: random.Random, scale: float) -> str:
+    side = _side(130, scale)
+
+    # Actual inputs always let the guard leave the lab, after a long walk that leaves
+    # room for loops: out of random labs, keep the one with the longest walk
+    best, best_walk = None, 0
+    for _ in range(200):
+        grid = [
+            ["#" if rng.random() < 0.03 else "." for _ in range(side)]
+            for _ in range(side)
+        ]
+        x, y = rng.randrange(side), rng.randrange(1, side)
+        grid[y][x] = "^"
+        grid[y - 1][x] = "."  # The guard starts with a step forward
+
+        if (walk := _guard_walk(grid, x, y)) > best_walk:
+            best, best_walk = grid, walk
+
+    if best is None:
+        raise RuntimeError("Could not generate a lab the guard can leave")
+
+    return "".join("".join(row) + "\n" for row in best)
+
+
+@generator(7)
+def calibration_equations(rng: random.Random, scale: float) -> str:
+    lines = []
+    for _ in range(_scaled(850, scale)):
+        operands = [rng.randint(1, 999) for _ in range(rng.randint(2, 9))]
+
+        if rng.random() < 0.5:
+            test_value = rng.randint(1, 10 ** rng.randint(3, 14))
+        else:
+            test_value = operands[0]
+            for operand in operands[1:]:
+                operator = rng.choice("+*|")
+                if operator == "+":
+                    test_value += operand
+                elif operator == "*":
+                    test_value *= operand
+                else:
+                    test_value = int(f"{test_value}{operand}")
+
+        lines.append(f"{test_value}: {' '.join(map(str, operands))}")
+
+    return "\n".join(lines) + "\n"
+
+
+@generator(8)
+def antennas(rng: random.Random, scale: float) -> str:
+    side = _side(50, scale)
+    grid = [["."] * side for _ in range(side)]
+
+    frequencies = string.digits + string.ascii_letters
+    for _ in range(_scaled(200, scale)):
+        grid[rng.randrange(side)][rng.randrange(side)] = rng.choice(frequencies)
+
+    return "".join("".join(row) + "\n" for row in grid)
+
+
+@generator(9)
+def disk_map(rng: random.Random, scale: float) -> str:
+    n_files = _scaled(10000, scale)
+    digits = []
+    for i in range(n_files):
+        digits.append(rng.randint(1, 9))
+        if i < n_files - 1:
+            digits.append(rng.randint(0, 9))
+
+    return "".join(map(str, digits)) + "\n"
+
+
+@generator(10)
+def topographic_map(rng: random.Random, scale: float) -> str:
+    side = _side(50, scale)
+    grid = [[rng.randint(0, 9) for _ in range(side)] for _ in range(side)]
+
+    # Trails from 0 to 9, each step to a neighbour not yet on the trail. Trails may
+    # cross or join earlier ones where heights agree, but never overwrite them, so
+    # that there are as many per cell at any scale
+    laid = {}
+    for _ in range(_scaled(600, scale)):
+        x, y = rng.randrange(side), rng.randrange(side)
+        if laid.get((x, y), 0) != 0:
+            continue
+
+        trail = [(x, y)]
+        while len(trail) < 10:
+            steps = [
+                (nx, ny)
+                for nx, ny in ((x, y + 1), (x + 1, y), (x, y - 1), (x - 1, y))
+                if 0 <= nx < side and 0 <= ny < side
+                and (nx, ny) not in trail
+                and laid.get((nx, ny), len(trail)) == len(trail)
+            ]
+            if not steps:  # Cornered: the trail is dropped
+                break
+            x, y = rng.choice(steps)
+            trail.append((x, y))
+        else:
+            for height, (x, y) in enumerate(trail):
+                grid[y][x] = laid[x, y] = height
+
+    return "".join("".join(map(str, row)) + "\n" for row in grid)
+
+
+@generator(11)
+def stones(rng: random.Random, scale: float) -> str:
+    return " ".join(
+        str(rng.randint(0, 10**7)) for _ in range(_scaled(8, scale))
+    ) + "\n"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate synthetic AoC 2024 inputs")
+    parser.add_argument("day", type=int, choices=sorted(GENERATORS))
+    parser.add_argument(
+        "-x", "--scale", type=float, default=1, help="Size relative to a puzzle input"
+    )
+    parser.add_argument("-s", "--seed", type=int, default=0)
+    parser.add_argument(
+        "-c",
+        "--compression",
+        choices=sorted(lib.CODECS),
+        default="",
+        help="Compress the default output (solvers read it as is)",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=pathlib.Path,
+        help=f"Output file ('-' for stdout; default: under {GENERATED})",
+    )
+    args = parser.parse_args()
+
+    if str(args.output) == "-":
+        sys.stdout.write(generate(args.day, args.scale, args.seed))
+        return
+
+    path = write(args.day, args.scale, args.seed, args.output, args.compression)
+    print(f"Generated {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,26 @@
 import abc
+import array
 import collections
+import collections.abc
+import dataclasses
+import datetime
 import enum
+import functools
+import hashlib
+import importlib
+import io
 import itertools
+import json
+import logging
 import math
+import mmap
+import os
 import pathlib
 import re
-from typing import Any, Iterable, Union
+import struct
+import sys
+import time
+from typing import Any, BinaryIO, Callable, Iterable, Union
 
 import colorama
 
@@ -13,87 +28,1129 @@ colorama.init(convert=True)
 
 INPUTS = pathlib.Path("inputs")
 RESULTS = pathlib.Path("results")
+PROFILES = RESULTS / "profiles"
 SOLUTIONS = pathlib.Path(__file__).parent
 
 URL = "https://adventofcode.com/2024"
 
+# Tracing: one logger per component, "aoc.day_XX" for the solvers and "aoc.lib.<x>"
+# for lib. See configure_tracing
+TRACER = logging.getLogger("aoc")
+
+
+class Lazy:
+    """A trace message argument only built (by calling `f`) if the message is emitted"""
+
+    def __init__(self, f, *args, **kwargs):
+        self.f, self.args, self.kwargs = f, args, kwargs
+
+    def __str__(self):
+        return str(self.f(*self.args, **self.kwargs))
+
+
+class RingBufferHandler(logging.Handler):
+    """Keeps the last `capacity` trace messages in memory, to be dumped when needed"""
+
+    def __init__(self, capacity: int = 10000):
+        super().__init__()
+        self.messages = collections.deque(maxlen=capacity)
+
+    def emit(self, record: logging.LogRecord):
+        self.messages.append(self.format(record))
+
+    def dump(self, file=None):
+        for message in self.messages:
+            print(message, file=file or sys.stderr)
+
+
+def configure_tracing(
+    levels: str = "INFO", output: str | pathlib.Path | None = None, ring: int = 0
+) -> logging.Handler:
+    """Sets the trace levels and where traces go (stderr, a file or a ring buffer).
+
+    `levels` is like "WARNING,day_06=DEBUG,lib.maze=DEBUG": a bare level applies to
+    every component. Disabled levels cost a (cached) level check per trace call.
+    """
+    for spec in filter(None, levels.split(",")):
+        component, _, level = spec.rpartition("=")
+        tracer = TRACER.getChild(component) if component else TRACER
+        tracer.setLevel(level.upper())
+
+    if ring:
+        handler = RingBufferHandler(ring)
+    elif output is not None:
+        handler = logging.FileHandler(output)
+    else:
+        handler = logging.StreamHandler(sys.stderr)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+
+    for old_handler in TRACER.handlers:
+        TRACER.removeHandler(old_handler)
+    TRACER.addHandler(handler)
+    TRACER.propagate = False
+
+    return handler
+
+
+configure_tracing(os.environ.get("AOC_TRACE", "INFO"))
+
+
+def load_json(path: pathlib.Path) -> dict:
+    try:
+        with path.open() as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def dump_json_atomic(path: pathlib.Path, data: dict):
+    """Writes to a temporary file that then replaces `path`, so readers never see a
+    partial file"""
+    import tempfile
+
+    path.parent.mkdir(exist_ok=True)
+    with tempfile.NamedTemporaryFile(
+        "w", dir=path.parent, suffix=".tmp", delete=False
+    ) as f:
+        json.dump(data, f, indent=1, sort_keys=True)
+    os.replace(f.name, path)
+
+
+class ResultPolicy(enum.StrEnum):
+    """What to do with a result that is new or does not match the stored one"""
+
+    ASK = "ask"  # Prompt the user
+    VERIFY = "verify"  # Only compare, never store
+    ACCEPT = "accept"  # Store it
+    FAIL = "fail"  # Raise on mismatches, never store
+
+
+class ResultStore:
+    """All the results in a single JSON file, loaded once and written atomically.
+
+    Results set are kept pending until `flush`, which merges them into what is on disk.
+    The legacy `results/day_XX_N.txt` files are imported the first time.
+    """
+
+    def __init__(self, path: pathlib.Path = RESULTS / "results.json"):
+        self.path = path
+        self._results = None  # type: dict[str, dict[str, str]] | None
+        self._pending = collections.defaultdict(dict)
+
+    @property
+    def results(self) -> dict[str, dict[str, str]]:
+        if self._results is None:
+            if self.path.exists():
+                self._results = load_json(self.path)
+            else:
+                self._results = self._read_legacy()
+                for day, parts in self._results.items():
+                    self._pending[day] |= parts
+
+        return self._results
+
+    def _read_legacy(self) -> dict[str, dict[str, str]]:
+        results = collections.defaultdict(dict)
+        for f_result in self.path.parent.glob("day_*_*.txt"):
+            _, day, part = f_result.stem.split("_")
+            with f_result.open() as f:
+                results[str(int(day))][part] = f.read().strip()
+
+        return dict(results)
+
+    def get(self, day: int, part: int) -> str | None:
+        return self.results.get(str(day), {}).get(str(part))
+
+    def set(self, day: int, part: int, result: Any):
+        self.results.setdefault(str(day), {})[str(part)] = str(result)
+        self._pending[str(day)][str(part)] = str(result)
+
+    def check(self, day: int, part: int, result: Any, policy: ResultPolicy) -> str:
+        """Compares `result` with the stored one, applying a (non-interactive) policy.
+
+        Returns ★ if it matches (or got stored), ✗ on a mismatch and ☆ otherwise.
+        """
+        if result is None:
+            return "☆"
+
+        if (saved := self.get(day, part)) == str(result):
+            return "★"
+
+        if saved is not None and policy == ResultPolicy.FAIL:
+            raise RuntimeError(
+                f"Day {day} result {part} does not match ({saved=}, {result=})"
+            )
+
+        if policy == ResultPolicy.ACCEPT:
+            self.set(day, part, result)
+            return "★"
+
+        return "☆" if saved is None else "✗"
+
+    def flush(self):
+        if not self._pending:
+            return
+
+        results = load_json(self.path)
+        for day, parts in self._pending.items():
+            results.setdefault(day, {}).update(parts)
+
+        dump_json_atomic(self.path, results)
+
+        self._results = results
+        self._pending.clear()
+
+
+RESULT_STORE = ResultStore()
+
+
+class MemoCache:
+    """Results of previous runs, keyed by a hash of the input and of the solver source.
+
+    Only the `max_entries` most recently used entries are kept.
+    """
+
+    def __init__(self, path: pathlib.Path = RESULTS / "memo.json", max_entries=64):
+        self.path = path
+        self.max_entries = max_entries
+
+    @staticmethod
+    def key(input_digest: bytes, solver_cls: type, parts=(1, 2)) -> str:
+        h = hashlib.sha256(input_digest)
+        h.update(repr(tuple(parts)).encode())
+        h.update(solver_cls.__qualname__.encode())  # Engines share their source file
+
+        import inspect
+
+        for cls in solver_cls.__mro__:
+            try:
+                source_file = inspect.getsourcefile(cls)
+            except TypeError:  # Built-in
+                continue
+            if source_file is None or cls is abc.ABC:
+                continue
+
+            with open(source_file, "rb") as f:
+                h.update(f.read())
+
+        return h.hexdigest()
+
+    def get(self, key: str) -> dict | None:
+        return load_json(self.path).get(key)
+
+    def set(self, key: str, entry: dict):
+        entries = load_json(self.path)
+        entries[key] = entry | {"used": time.time()}
+
+        by_use = sorted(entries, key=lambda k: entries[k]["used"], reverse=True)
+        for stale in by_use[self.max_entries :]:
+            del entries[stale]
+
+        dump_json_atomic(self.path, entries)
+
+
+MEMO_CACHE = MemoCache()
+
+
+def evict_lru(directory: pathlib.Path, pattern: str, max_bytes: int):
+    """Removes the least recently modified files matching `pattern` until they take
+    at most `max_bytes`. Other processes may be removing them too"""
+    entries = []
+    for f in directory.glob(pattern):
+        try:
+            stat = f.stat()
+        except FileNotFoundError:  # Removed by another process meanwhile
+            continue
+        entries.append((stat.st_mtime, stat.st_size, f))
+    entries.sort()
+    total = sum(size for _, size, _ in entries)
+
+    for _, size, f in entries:
+        if total <= max_bytes:
+            break
+        f.unlink(missing_ok=True)
+        total -= size
+
+
+class ParseCache:
+    """Parsed inputs as packed binary files, keyed by the input hash and the reader.
+
+    An entry is an 8-byte aligned JSON header followed by its arrays, which are loaded
+    as memoryviews over a memory map of the file: nothing is copied. The least
+    recently used entries are evicted once the directory exceeds `max_bytes`. Several
+    processes may share the directory (e.g. run.py -j N).
+
+    Readers stop building an entry past `max_entry_bytes`, so that parsing larger
+    inputs does not hold them in memory.
+
+    With `in_memory`, loaded entries are also kept in memory (e.g. in a long-lived
+    process, see run.py --watch), as long as this module is not reloaded. So are the
+    items of the readers not stored in files (`kept`), once read in full.
+    """
+
+    _HEADER_SIZE = struct.Struct("<Q")
+
+    def __init__(
+        self,
+        path: pathlib.Path = RESULTS / "parsed",
+        max_bytes=256 * 2**20,
+        max_entry_bytes=16 * 2**20,
+        in_memory=False,
+    ):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_entry_bytes
+        self.in_memory = in_memory
+        self._loaded = {}  # type: dict[str, tuple[dict, list[memoryview]]]
+        self.kept = {}  # type: dict[str, list]
+
+    @staticmethod
+    def key(input_digest: bytes, *reader_args) -> str:
+        return hashlib.sha256(input_digest + repr(reader_args).encode()).hexdigest()
+
+    def load(self, key: str) -> tuple[dict, list[memoryview]] | None:
+        if self.in_memory and key in self._loaded:
+            return self._loaded[key]
+
+        f_entry = self.path / f"{key}.bin"
+        try:
+            with f_entry.open("rb") as f:
+                data = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+        except FileNotFoundError:
+            return None
+        try:
+            os.utime(f_entry)  # Mark as recently used
+        except FileNotFoundError:  # Evicted by another process meanwhile
+            pass
+
+        (header_size,) = self._HEADER_SIZE.unpack_from(data)
+        start = self._HEADER_SIZE.size
+        header = json.loads(bytes(data[start : start + header_size]))
+        start += header_size
+
+        arrays = []
+        for size in header["sizes"]:
+            arrays.append(data[start : start + size])
+            start += size
+
+        if self.in_memory:
+            self._loaded[key] = header, arrays
+        return header, arrays
+
+    def store(self, key: str, header: dict, *arrays: bytes | array.array):
+        header = header | {"sizes": [memoryview(a).nbytes for a in arrays]}
+        header_bytes = json.dumps(header).encode()
+        header_bytes += b" " * (-len(header_bytes) % 8)
+
+        import tempfile
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=self.path, suffix=".tmp", delete=False) as f:
+            f.write(self._HEADER_SIZE.pack(len(header_bytes)))
+            f.write(header_bytes)
+            for a in arrays:
+                f.write(a)
+        os.replace(f.name, self.path / f"{key}.bin")
+
+        evict_lru(self.path, "*.bin", self.max_bytes)
+
+
+PARSE_CACHE = ParseCache()
+
+
+class CheckpointStore:
+    """Pickled snapshots of the working state of long solves, to resume them.
+
+    They are named after the day, the input hash and the solver source hash, so that
+    a changed solver never resumes from a stale state. Saving one removes those of
+    other solver sources for the same input, and the least recently saved ones are
+    evicted once the directory exceeds `max_bytes`: solves that never finish do not
+    get them cleared.
+    """
+
+    def __init__(
+        self, path: pathlib.Path = RESULTS / "checkpoints", max_bytes=1024 * 2**20
+    ):
+        self.path = path
+        self.max_bytes = max_bytes
+
+    def _file(self, day: int, key: str, name: str) -> pathlib.Path:
+        return self.path / f"day_{day:02}_{key}_{name}.pkl"
+
+    def load(self, day: int, key: str, name: str) -> Any | None:
+        import pickle
+
+        f_checkpoint = self._file(day, key, name)
+        try:
+            with f_checkpoint.open("rb") as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:  # Unreadable (e.g. a class it needs is gone): discarded
+            f_checkpoint.unlink(missing_ok=True)
+            return None
+
+    def save(self, day: int, key: str, name: str, state: Any):
+        import pickle
+        import tempfile
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=self.path, suffix=".tmp", delete=False) as f:
+            pickle.dump(state, f, pickle.HIGHEST_PROTOCOL)
+        os.replace(f.name, f_checkpoint := self._file(day, key, name))
+
+        input_key, _ = key.split("_")
+        for f_stale in self.path.glob(f"day_{day:02}_{input_key}_*_{name}.pkl"):
+            if f_stale != f_checkpoint:
+                f_stale.unlink(missing_ok=True)
+        evict_lru(self.path, "*.pkl", self.max_bytes)
+
+    def clear(self, day: int, input_key: str):
+        """Removes the day's checkpoints for an input, whatever the solver source"""
+        for f_checkpoint in self.path.glob(f"day_{day:02}_{input_key}_*.pkl"):
+            f_checkpoint.unlink(missing_ok=True)
+
+
+CHECKPOINTS = CheckpointStore()
+
+
+class TimingHistory:
+    """Timings of every stage of every timed run, as JSON lines appended to a file.
+
+    Baselines only take into account the runs on the same host and Python version,
+    and from the same source: run.py's single cold runs and bench.py's warm medians
+    are not comparable.
+
+    The file is read once per process. Only the last `keep` entries of each day,
+    source and context are kept: the file is trimmed when read if it has more.
+    """
+
+    def __init__(self, path: pathlib.Path = RESULTS / "history.jsonl", keep=20):
+        self.path = path
+        self.keep = keep
+        self._entries = None  # type: list[dict] | None
+
+    @functools.cached_property
+    def context(self) -> dict[str, str]:
+        import platform
+
+        return {"python": platform.python_version(), "host": platform.node()}
+
+    def append(self, day: int, timings: dict[str, float | None], source: str = "run"):
+        entry = {
+            "at": datetime.datetime.now().isoformat(timespec="seconds"),
+            "day": day,
+            "source": source,
+            "timings": {stage: t for stage, t in timings.items() if t is not None},
+        } | self.context
+
+        self.path.parent.mkdir(exist_ok=True)
+        with self.path.open("a") as f:
+            f.write(json.dumps(entry) + "\n")
+
+        if self._entries is not None:
+            self._entries.append(entry)
+
+    def _load(self) -> list[dict]:
+        if self._entries is not None:
+            return self._entries
+
+        try:
+            with self.path.open() as f:
+                entries = [json.loads(line) for line in f]
+        except FileNotFoundError:
+            entries = []
+
+        groups = collections.defaultdict(list)
+        for entry in entries:
+            context = tuple(entry.get(k) for k in ("python", "host"))
+            groups[entry["day"], entry["source"], context].append(entry)
+        stale = {id(e) for group in groups.values() for e in group[: -self.keep]}
+
+        if stale:
+            import tempfile
+
+            entries = [entry for entry in entries if id(entry) not in stale]
+            with tempfile.NamedTemporaryFile(
+                "w", dir=self.path.parent, suffix=".tmp", delete=False
+            ) as f:
+                f.writelines(json.dumps(entry) + "\n" for entry in entries)
+            os.replace(f.name, self.path)
+
+        self._entries = entries
+        return entries
+
+    def entries(
+        self,
+        day: int | None = None,
+        same_context: bool = False,
+        source: str | None = None,
+    ):
+        for entry in self._load():
+            if day is not None and entry["day"] != day:
+                continue
+            if source is not None and entry["source"] != source:
+                continue
+            if same_context and any(entry[k] != v for k, v in self.context.items()):
+                continue
+            yield entry
+
+    def last(self, day: int, source: str = "run") -> dict[str, float] | None:
+        last = None
+        for last in self.entries(day, source=source):
+            pass
+
+        return last["timings"] if last else None
+
+    def baseline(
+        self, day: int, window: int = 5, source: str = "run"
+    ) -> dict[str, float]:
+        """Median of each stage over the last `window` runs"""
+        import statistics
+
+        stages = collections.defaultdict(list)
+        for entry in self.entries(day, same_context=True, source=source):
+            for stage, t in entry["timings"].items():
+                stages[stage].append(t)
+
+        return {stage: statistics.median(ts[-window:]) for stage, ts in stages.items()}
+
+    def regressions(
+        self,
+        day: int,
+        timings: dict[str, float | None],
+        threshold: float,
+        min_time: float = 1e-3,
+        source: str = "run",
+    ) -> list[str]:
+        """Stages more than `threshold` (e.g. 0.2 for 20%) slower than the baseline.
+        Stages faster than `min_time` are too noisy to be compared"""
+        regressions = []
+        baseline = self.baseline(day, source=source)
+
+        for stage, t in timings.items():
+            if t is None or (base := baseline.get(stage)) is None:
+                continue
+            if max(t, base) < min_time:
+                continue
+            if t > base * (1 + threshold):
+                regressions.append(
+                    f"Day {day} {stage}: {t:.4f}s vs {base:.4f}s (+{t / base - 1:.0%})"
+                )
+
+        return regressions
+
+
+TIMING_HISTORY = TimingHistory()
+
+
+class Progress:
+    """Progress of a loop on stderr, with its rate and ETA, redrawn at most every
+    INTERVAL seconds. Disabled (at no cost per item when iterating) if stderr is not a
+    terminal. Either iterate over it or call `advance` from the loop.
+
+    `check` is called at each step, e.g. to cancel the loop by raising"""
+
+    INTERVAL = 0.25
+
+    def __init__(
+        self,
+        iterable: Iterable | None = None,
+        total: int | None = None,
+        label: str = "",
+        enabled: bool = True,
+        check: Callable[[], None] | None = None,
+    ):
+        if total is None and isinstance(iterable, collections.abc.Sized):
+            total = len(iterable)
+
+        self.iterable, self.total, self.label = iterable, total, label
+        self.enabled = enabled and sys.stderr.isatty()
+        self.check = check
+        self.n = 0
+        self._t0 = self._next_draw = time.perf_counter()
+        self._drawn = False
+        self._width = 0
+
+    def __iter__(self):
+        if not self.enabled and self.check is None:
+            yield from self.iterable
+            return
+
+        with self:
+            for item in self.iterable:
+                yield item
+                self.advance()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __str__(self):
+        status = f"{self.n}/{self.total}" if self.total else f"{self.n}"
+        return f"{self.label}: {status}" if self.label else status
+
+    def advance(self, n: int = 1):
+        self.n += n
+        if self.check is not None:
+            self.check()
+        if self.enabled and (now := time.perf_counter()) >= self._next_draw:
+            self._next_draw = now + self.INTERVAL
+            self._draw(now)
+
+    def close(self):
+        if self._drawn:
+            self._draw(time.perf_counter())
+            print(file=sys.stderr)
+            self._drawn = False
+
+    def _draw(self, now: float):
+        elapsed = now - self._t0
+        rate = self.n / elapsed if elapsed else 0.0
+
+        status = f"{self.n}"
+        if self.total:
+            status += f"/{self.total} {self.n / self.total:4.0%}"
+        status += f" {rate:,.1f}/s {elapsed:.1f}s"
+        if self.total and rate:
+            status += f" ETA {(self.total - self.n) / rate:.1f}s"
+
+        line = f"{self.label}: {status}" if self.label else status
+        # Padded over the previous line (colorama would choke on an erase sequence)
+        print(f"\r{line:<{self._width}}", end="", file=sys.stderr, flush=True)
+        self._width = len(line)
+        self._drawn = True
+
+
+def format_bytes(n: int) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if abs(n) < 1024:
+            return f"{n:.0f} {unit}" if unit == "B" else f"{n:.1f} {unit}"
+        n /= 1024
+
+    return f"{n:.1f} GiB"
+
+
+class BudgetExceeded(Exception):
+    """Raised by Solver.check_budget to cancel a part over its time or memory budget"""
+
+    def __init__(self, reason: str, progress: str = ""):
+        super().__init__(reason, progress)
+        self.reason, self.progress = reason, progress
+
+    def __str__(self):
+        return f"{self.reason}, at {self.progress}" if self.progress else self.reason
+
+
+def _traced_memory() -> int:
+    """Memory currently traced by tracemalloc"""
+    import tracemalloc
+
+    return tracemalloc.get_traced_memory()[0]
+
+
+def percentile(values: list[float], p: float) -> float:
+    """Nearest-rank percentile"""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(p / 100 * len(ordered)) - 1)]
+
+
+@dataclasses.dataclass
+class SolveReport:
+    """Picklable summary of a solver run, to be sent across processes"""
+
+    day: int
+    result_1: Any = None
+    result_2: Any = None
+    timings: dict[str, float | None] = dataclasses.field(default_factory=dict)
+    stars: tuple[str, str] = ("☆", "☆")
+    memory: dict[str, int] = dataclasses.field(default_factory=dict)
+    allocations: dict[str, list[str]] = dataclasses.field(default_factory=dict)
+    metrics: dict[str, int | float] = dataclasses.field(default_factory=dict)
+    timeouts: dict[str, str] = dataclasses.field(default_factory=dict)
+    memoized: bool = False
+    # Resumed from a checkpoint, so its timings are not those of a whole solve
+    resumed: bool = False
+    error: str | None = None
+
+    @property
+    def total(self) -> float:
+        return sum(t for t in self.timings.values() if t is not None)
+
+
+class InputSource(abc.ABC):
+    """Where an input comes from. It can be read several times (e.g. hashed, then
+    parsed): each `open` returns a new binary stream over it"""
+
+    @abc.abstractmethod
+    def open(self) -> BinaryIO: ...
+
+    def buffer(self) -> memoryview | None:
+        """The whole input as a read-only buffer, without reading it up front, or None
+        if it cannot be (e.g. compressed inputs, which can only be streamed)"""
+        return None
+
+    def digest(self) -> bytes:
+        with self.open() as f:
+            return hashlib.file_digest(f, "sha256").digest()
+
+
+# Openers of compressed files, by suffix, decompressing as they are read
+CODECS = {".gz": "gzip", ".bz2": "bz2", ".xz": "lzma"}
+
+
+def open_maybe_compressed(path: pathlib.Path, mode="rb"):
+    """Opens `path`, (de)compressing it on the fly if its suffix is one of CODECS"""
+    if (codec := CODECS.get(path.suffix)) is None:
+        return open(path, mode)
+    return importlib.import_module(codec).open(path, mode)
+
+
+class FileInput(InputSource):
+    """An input file, compressed or not (see CODECS): its digest and what the readers
+    get are those of the decompressed input"""
+
+    def __init__(self, path: str | os.PathLike):
+        self.path = pathlib.Path(path)
+
+    def open(self) -> BinaryIO:
+        return open_maybe_compressed(self.path)
+
+    def buffer(self) -> memoryview | None:
+        """A memory map of the file: pages are only read as they are accessed, and the
+        map is released with the last view of it"""
+        if self.path.suffix in CODECS:
+            return None
+
+        with self.path.open("rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:  # Empty files cannot be mapped
+                return memoryview(b"")
+            return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def __str__(self):
+        return str(self.path)
+
+
+class BufferInput(InputSource):
+    """An input already in memory, opened without copying it again"""
+
+    def __init__(self, data: bytes | bytearray | memoryview):
+        # BytesIO only shares bytes objects: anything else would be copied per open
+        self.data = data if isinstance(data, bytes) else bytes(data)
+
+    def open(self) -> BinaryIO:
+        return io.BytesIO(self.data)
+
+    def buffer(self) -> memoryview:
+        return memoryview(self.data)
+
+    def __str__(self):
+        return f"<{len(self.data)} bytes>"
+
+
+def as_input(source) -> InputSource:
+    """The input source of a path, a buffer (bytes, memoryview...) or a binary stream,
+    like sys.stdin.buffer or a pipe, which is read (once) into memory"""
+    if isinstance(source, InputSource):
+        return source
+    if isinstance(source, (str, os.PathLike)):
+        return FileInput(source)
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return BufferInput(source)
+    if hasattr(source, "read"):
+        return BufferInput(source.read())
+
+    raise TypeError(f"Not an input source: {source!r}")
+
 
 class Solver(abc.ABC):
     DEBUG = False
-
-    def __init__(self, day_of_month):
+    RESULT_POLICY = ResultPolicy.ASK
+    # Reuse the results of a previous run on the same input and solver source
+    MEMOIZE = True
+    # Keep the readers' parsed inputs in binary form, see ParseCache
+    PARSE_CACHE = True
+    # If set, profile each stage, printing the top PROFILE_TOP entries (see _run_stage)
+    PROFILE_TOP = 0
+    # If set, trace the peak memory of each stage and its top allocation sites
+    TRACE_MEMORY_TOP = 0
+    # If set, collect the counters and gauges of count() and gauge()
+    METRICS = False
+    # If set, show the progress of long loops (see progress()) on a terminal
+    PROGRESS = True
+    # Seconds, and bytes (traced by tracemalloc), each part may take before being
+    # cancelled. Solvers cooperate by calling check_budget(), as progress() loops do
+    TIME_BUDGET = None  # type: float | None
+    MEMORY_BUDGET = None  # type: int | None
+    # Minimum seconds between the checkpoints of long solves (see checkpoint()).
+    # None disables both checkpoints and resuming from them
+    CHECKPOINT_INTERVAL = 60.0  # type: float | None
+
+    # Name of the implementation. A day's `Solver` is its "reference" engine, and
+    # faster ones subclass it, overriding what they speed up (see DayRegistry.engines)
+    ENGINE = "reference"
+
+    STAGES = ("parse", "part 1", "part 2")
+    # Expected exponent of the growth of each stage's time with the input size
+    EXPECTED_GROWTH = dict.fromkeys(STAGES, 1.0)
+
+    def __init__(self, day_of_month, parts=(1, 2), source=None):
+        """`source` is the input (see as_input), by default inputs/day_XX.txt"""
         self.day_of_month = day_of_month
+        self.parts = tuple(parts)
 
-        self.filename = INPUTS / f"day_{day_of_month:02}.txt"
+        # The stored results are those of the day's own input: others are not checked
+        self.own_input = source is None
+        if source is None:
+            source = INPUTS / f"day_{day_of_month:02}.txt"
+        self.source = as_input(source)
+
+        self.tracer = TRACER.getChild(f"day_{day_of_month:02}")
+        if self.DEBUG:
+            self.tracer.setLevel(logging.DEBUG)
 
         self.result_1 = self.result_2 = None
+        self.result_store = RESULT_STORE
+        self.memo_cache = MEMO_CACHE
+        self.memo_hit = False
+        self.resumed = False
+        self.parse_cache = PARSE_CACHE
+        self.checkpoints = CHECKPOINTS
+        self._last_checkpoint = time.perf_counter()
+
+        self.timings = dict.fromkeys(self.STAGES)
+        self._lap_start = self._lap_parse = 0.0
+
+        # Peak memory (over the memory in use when starting) and top allocation sites,
+        # per stage, with TRACE_MEMORY_TOP
+        self.memory = {}  # type: dict[str, int]
+        self.allocations = {}  # type: dict[str, list[str]]
+
+        # Counters and gauges, by "<stage>: <name>", with METRICS
+        self.metrics = {}  # type: dict[str, int | float]
+        self._stage = "solve"
+
+        # Parts cancelled by their budget, with how far they got
+        self.timeouts = {}  # type: dict[str, str]
+        self._deadline = math.inf
+        self._memory_base = 0
+        self._progress = None  # type: Progress | None
+
+    @functools.cached_property
+    def input_digest(self) -> bytes:
+        return self.source.digest()
+
+    def open_input(self):
+        """A new text stream over the input"""
+        return io.TextIOWrapper(self.source.open(), encoding="utf-8")
+
+    def input_lines(self):
+        """Yields the lines of the input, with their line ends, streamed: memory use
+        does not grow with the input size"""
+        with self.open_input() as f:
+            yield from f
 
     def read(self):
-        with self.filename.open() as f:
-            return f.read()
+        t0 = time.perf_counter()
+        data = self._read()
+        self._add_parse_time(time.perf_counter() - t0)
+        return data
+
+    def _read(self) -> str:
+        if (buffer := self.source.buffer()) is None:
+            with self.open_input() as f:
+                return f.read()
+
+        text = str(buffer, "utf-8")
+        if "\r" in text:  # Translated as text streams do
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        return text
 
     def read_lines_typed(self, type_, sep=None):
-        with self.filename.open() as f:
-            for line in f.readlines():
-                yield tuple(map(type_, line.strip().split(sep)))
+        if self.PARSE_CACHE and type_ in (int, float):
+            return self._timed_parse(self._read_lines_typed_cached(type_, sep))
+        lines = self._read_lines_typed(type_, sep)
+        return self._timed_parse(self._kept_in_memory(lines, "lines_typed", type_, sep))
+
+    def _read_lines_typed(self, type_, sep):
+        for line in self.input_lines():
+            yield tuple(map(type_, line.strip().split(sep)))
+
+    def _read_lines_typed_cached(self, type_, sep):
+        """Same as `_read_lines_typed`, the lines stored as an array of values plus an
+        array of where each line starts"""
+        typecode = "q" if type_ is int else "d"
+        key = self.parse_cache.key(self.input_digest, "lines_typed", typecode, sep)
+
+        if (entry := self.parse_cache.load(key)) is None:
+            self.count("parse cache misses")
+            # Packed as the lines are yielded, so that they are still streamed
+            offsets, values = array.array("q", [0]), array.array(typecode)
+            max_values = self.parse_cache.max_entry_bytes // values.itemsize
+            for line in self._read_lines_typed(type_, sep):
+                if values is not None:
+                    try:
+                        values.extend(line)
+                        offsets.append(len(values))
+                    except OverflowError:  # Not fitting in 64 bits: not cached
+                        offsets = values = None
+                    if values is not None and len(offsets) + len(values) > max_values:
+                        offsets = values = None  # Too large to hold: not cached
+                yield line
+
+            if values is not None:
+                self.parse_cache.store(key, {}, offsets, values)
+            return
+
+        self.count("parse cache hits")
+        _, (offsets, values) = entry
+        offsets, values = offsets.cast("q"), values.cast(typecode)
+
+        for start, end in itertools.pairwise(offsets):
+            yield tuple(values[start:end])
 
     def read_lines_re(self, pattern, type_=None, split=False):
-        with self.filename.open() as f:
-            for line in f.readlines():
-                raw = line.strip()
+        lines = self._read_lines_re(pattern, type_, split)
+        return self._timed_parse(
+            self._kept_in_memory(lines, "lines_re", pattern, type_, split)
+        )
 
-                if split:
-                    matched_bits = re.split(pattern, raw)
-                else:
-                    matched_bits = re.match(pattern, raw).groups()
+    def _read_lines_re(self, pattern, type_, split):
+        for line in self.input_lines():
+            raw = line.strip()
 
-                if type_:
-                    yield tuple(type_(g) for g in matched_bits if g)
-                else:
-                    yield matched_bits
+            if split:
+                matched_bits = re.split(pattern, raw)
+            else:
+                matched_bits = re.match(pattern, raw).groups()
+
+            if type_:
+                yield tuple(type_(g) for g in matched_bits if g)
+            else:
+                yield matched_bits
 
     def read_maze_to_coords(self, ignore_symbol=None, type_=str):
-        with self.filename.open() as f:
-            for y, line in enumerate(f.readlines()):
-                for x, symbol in enumerate(line.strip()):
-                    if symbol != ignore_symbol:
-                        yield Position2D(x, y), type_(symbol)
+        # Not cached: building the positions of the cells costs more than reading them
+        lines = self._read_maze_lines(ignore_symbol, type_)
+        lines = self._kept_in_memory(lines, "maze", ignore_symbol, type_)
+        return itertools.chain.from_iterable(self._timed_parse(lines))
+
+    def _read_maze_lines(self, ignore_symbol, type_):
+        """The cells of each line, so that parsing is timed line by line"""
+        for y, line in enumerate(self.input_lines()):
+            yield [
+                (Position2D(x, y), type_(symbol))
+                for x, symbol in enumerate(line.strip())
+                if symbol != ignore_symbol
+            ]
+
+    def _kept_in_memory(self, gen, *reader_args):
+        """`gen`, or with an in-memory parse cache (run.py --watch), its items kept
+        from a first full read of the same input. They are shared by every solve, so
+        solvers must not modify them"""
+        if not (self.PARSE_CACHE and self.parse_cache.in_memory):
+            return gen
+        return self._kept(gen, self.parse_cache.key(self.input_digest, *reader_args))
+
+    def _kept(self, gen, key: str):
+        if (items := self.parse_cache.kept.get(key)) is None:
+            self.count("parse cache misses")
+            items = self.parse_cache.kept[key] = list(gen)
+        else:
+            self.count("parse cache hits")
+        yield from items
+
+    def _timed_parse(self, gen):
+        """Yields from `gen` (a line at a time), only accounting as parsing the time
+        spent inside it. Within the parse stage, which is timed as a whole, as is"""
+        if self._stage == "parse":
+            return gen
+        return self._timed_lines(gen)
+
+    def _timed_lines(self, gen):
+        while True:
+            t0 = time.perf_counter()
+            try:
+                item = next(gen)
+            except StopIteration:
+                self._add_parse_time(time.perf_counter() - t0)
+                return
+            self._add_parse_time(time.perf_counter() - t0)
+            yield item
+
+    def _add_parse_time(self, elapsed: float):
+        self.timings["parse"] = (self.timings["parse"] or 0.0) + elapsed
+
+    def _lap(self, stage: str):
+        """Records the time elapsed since the previous lap, minus the parsing done in between"""
+        now = time.perf_counter()
+        parsed = self.timings["parse"] or 0.0
+        self.timings[stage] = now - self._lap_start - (parsed - self._lap_parse)
+        self._lap_start, self._lap_parse = now, parsed
+
+    def parse(self) -> Any:
+        """Stage 1 (optional): parses the input, to be shared by both parts"""
+        return self.read()
+
+    def part_1(self, parsed: Any) -> Any:
+        """Stage 2: returns the result of part 1"""
+        raise NotImplementedError
 
-    @abc.abstractmethod
-    def solve(self) -> None:
+    def part_2(self, parsed: Any) -> Any:
+        """Stage 3: returns the result of part 2"""
         raise NotImplementedError
 
+    def solve(self) -> None:
+        """Runs the stages. Solvers not split in stages override this instead, and
+        then always solve both parts"""
+        t0 = time.perf_counter()
+        parsed = self._run_stage("parse", self.parse)
+        self.timings["parse"] = time.perf_counter() - t0
+        self._lap_start, self._lap_parse = time.perf_counter(), self.timings["parse"]
+
+        for part, f in ((1, self.part_1), (2, self.part_2)):
+            if part not in self.parts:
+                continue
+
+            try:
+                result = self._run_stage(f"part {part}", f, parsed)
+            except BudgetExceeded as e:
+                self._timed_out(part, e)
+            else:
+                self.resolved(**{f"result_{part}": result})
+
+    @property
+    def is_staged(self) -> bool:
+        return type(self).solve is Solver.solve
+
+    def _run_stage(self, stage: str, f, *args):
+        self._stage = stage
+        if stage != "parse":
+            self._start_budget()
+
+        profile = None
+        if self.PROFILE_TOP:
+            import cProfile
+
+            profile = cProfile.Profile()
+        run = f if profile is None else functools.partial(profile.runcall, f)
+        try:
+            if self.TRACE_MEMORY_TOP:
+                return self._trace_memory(stage, run, *args)
+            return run(*args)
+        finally:
+            # Only once the memory trace ended, not to trace printing the profile
+            if profile is not None:
+                self._print_profile(stage, profile)
+
+    # Modules whose allocations are those of the tracing and profiling themselves
+    _UNTRACED = ("tracemalloc", "cProfile", "pstats")
+
+    def _trace_memory(self, stage: str, f, *args):
+        import tracemalloc
+
+        untraced = [
+            tracemalloc.Filter(False, importlib.import_module(module).__file__)
+            for module in self._UNTRACED
+        ]
+        before = tracemalloc.take_snapshot().filter_traces(untraced)
+        in_use, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        try:
+            return f(*args)
+        finally:
+            _, peak = tracemalloc.get_traced_memory()
+            self.memory[stage] = peak - in_use
+
+            after = tracemalloc.take_snapshot().filter_traces(untraced)
+            self.allocations[stage] = [
+                f"{format_bytes(diff.size_diff):>10} {diff.traceback}"
+                for diff in after.compare_to(before, "lineno")[: self.TRACE_MEMORY_TOP]
+            ]
+
+    def _print_profile(self, stage: str, profile: "cProfile.Profile"):
+        """Dumps the profile of a stage and prints its top entries, plus those of `lib`
+        (where Position2D, Maze, etc. are)"""
+        import pstats
+
+        PROFILES.mkdir(parents=True, exist_ok=True)
+        f_stats = PROFILES / f"day_{self.day_of_month:02}_{stage.replace(' ', '_')}.pstats"
+        profile.dump_stats(f_stats)
+
+        stats = pstats.Stats(profile, stream=sys.stderr)
+        print(f"Day {self.day_of_month} {stage} profile ({f_stats}):", file=sys.stderr)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.PROFILE_TOP)
+        print(f"Day {self.day_of_month} {stage} profile, lib only:", file=sys.stderr)
+        stats.sort_stats(pstats.SortKey.TIME).print_stats(
+            r"[/\\]lib\.py:", self.PROFILE_TOP
+        )
+
     def resolved(self, *, result_1=None, result_2=None):
         if result_1 is not None:
             self.result_1 = result_1
+            self._lap("part 1")
             print(f"Result 1: {result_1}")
 
         if result_2 is not None:
             self.result_2 = result_2
+            self._lap("part 2")
             print(f"Result 2: {result_2}")
 
+        self._start_budget()  # Solvers not split in stages go on with part 2
+
         for i, result in enumerate((result_1, result_2), 1):
-            if result is None:
+            if result is None or not self.own_input:
                 continue
 
-            if (f_result := (RESULTS / f"day_{self.day_of_month:02}_{i}.txt")).exists():
-                with f_result.open() as f:
-                    if (saved_result := f.read().strip()) == str(result):
-                        print(f"Result {i} already exists and matches")
-                        continue
+            if self.RESULT_POLICY != ResultPolicy.ASK:
+                self.result_store.check(self.day_of_month, i, result, self.RESULT_POLICY)
+                continue
 
-                    print(
-                        f"Result {i} already exists but does not match ({saved_result=}, {result=})"
-                    )
-                    to_save = self._ask_user_yn_safe(f"Overwrite result {i}?")
+            if (saved_result := self.result_store.get(self.day_of_month, i)) is not None:
+                if saved_result == str(result):
+                    print(f"Result {i} already exists and matches")
+                    continue
+
+                print(
+                    f"Result {i} already exists but does not match ({saved_result=}, {result=})"
+                )
+                to_save = self._ask_user_yn_safe(f"Overwrite result {i}?")
 
             else:
                 to_save = self._ask_user_yn_safe(f"Save result {i}?")
 
             if to_save:
-                with f_result.open("w") as f:
-                    f.write(str(result))
-                    
+                self.result_store.set(self.day_of_month, i, result)
+
+        self.result_store.flush()
+
+    def stars(self) -> tuple[str, str]:
+        """★ for a result matching the stored one, ✗ for a mismatch and ☆ otherwise"""
+        if not self.own_input:
+            return "☆", "☆"
+
+        return tuple(
+            self.result_store.check(self.day_of_month, part, result, ResultPolicy.VERIFY)
+            for part, result in enumerate((self.result_1, self.result_2), 1)
+        )
+
+    def report(self) -> SolveReport:
+        return SolveReport(
+            day=self.day_of_month,
+            result_1=self.result_1,
+            result_2=self.result_2,
+            timings=dict(self.timings),
+            stars=self.stars(),
+            memory=dict(self.memory),
+            allocations=dict(self.allocations),
+            metrics=dict(self.metrics),
+            timeouts=dict(self.timeouts),
+            memoized=self.memo_hit,
+            resumed=self.resumed,
+        )
+
     def _ask_user_yn_safe(self, prompt: str, default: bool=False) -> bool:
         try:
             reply = input(prompt + ' (y/N) ').lower()
@@ -104,16 +1161,224 @@ class Solver(abc.ABC):
         return reply == 'y'
 
     def __call__(self):
-        self.solve()
+        self.timings = dict.fromkeys(self.STAGES)
+        self._lap_start, self._lap_parse = time.perf_counter(), 0.0
 
-        if self.result_1 is None:
-            print("Result 1: Not resolved")
-        if self.result_2 is None:
-            print("Result 2: Not resolved")
+        if self.MEMOIZE:
+            memo_key = self.memo_cache.key(self.input_digest, type(self), self.parts)
 
-    def printd(self, *args, **kwargs):
-        if self.DEBUG:
-            print(*args, **kwargs)
+            if (memo := self.memo_cache.get(memo_key)) is not None:
+                self.memo_hit = True
+                self.memo_cache.set(memo_key, memo)  # Refresh its last use
+                print("Memoized results:")
+                self.resolved(result_1=memo["result_1"], result_2=memo["result_2"])
+            else:
+                self._solve()
+                if not self.timeouts:  # Partial results are not memoized
+                    self.memo_cache.set(
+                        memo_key,
+                        {
+                            "day": self.day_of_month,
+                            "result_1": self.result_1,
+                            "result_2": self.result_2,
+                        },
+                    )
+        else:
+            self._solve()
+
+        results = {1: self.result_1, 2: self.result_2}
+        pending = [part for part in self.parts if results[part] is None]
+        for part in pending:
+            if f"part {part}" not in self.timeouts:
+                print(f"Result {part}: Not resolved")
+
+        if not pending and self.CHECKPOINT_INTERVAL is not None:
+            # Done with them, whichever solver source they were from
+            self.checkpoints.clear(self.day_of_month, self.input_digest.hex()[:16])
+
+    @functools.cached_property
+    def _checkpoint_key(self) -> str:
+        source_key = self.memo_cache.key(b"", type(self), ())
+        return f"{self.input_digest.hex()[:16]}_{source_key[:16]}"
+
+    def checkpoint(self, name: str, state: Callable[[], Any]):
+        """Saves the state returned by `state` (only called then) if CHECKPOINT_INTERVAL
+        seconds passed since the last checkpoint. Call it where the state is consistent,
+        e.g. between iterations, and rebuild from it what resume() gives back"""
+        if self.CHECKPOINT_INTERVAL is None:
+            return
+        if time.perf_counter() - self._last_checkpoint < self.CHECKPOINT_INTERVAL:
+            return
+
+        self.checkpoints.save(self.day_of_month, self._checkpoint_key, name, state())
+        self._last_checkpoint = time.perf_counter()
+        self.debug("Checkpoint saved:", name)
+
+    def resume(self, name: str) -> Any | None:
+        """The state of the latest checkpoint `name`, for this input and solver"""
+        if self.CHECKPOINT_INTERVAL is None:
+            return None
+
+        state = self.checkpoints.load(self.day_of_month, self._checkpoint_key, name)
+        if state is not None:
+            self.info("Resuming from checkpoint:", name)
+            self.resumed = True
+        return state
+
+    def count(self, name: str, n: int = 1):
+        """Adds `n` to a counter (e.g. nodes expanded). In hot loops, check METRICS
+        (copied to a local) before calling, so that disabled metrics cost nothing"""
+        if self.METRICS:
+            key = f"{self._stage}: {name}"
+            self.metrics[key] = self.metrics.get(key, 0) + n
+
+    def gauge(self, name: str, value: int | float):
+        """Keeps the maximum value seen of a gauge (e.g. a queue length)"""
+        if self.METRICS:
+            key = f"{self._stage}: {name}"
+            self.metrics[key] = max(self.metrics.get(key, value), value)
+
+    def progress(
+        self, iterable: Iterable | None = None, total: int | None = None, label=None
+    ) -> Progress:
+        """Wraps a loop to show its progress, e.g. `for x in self.progress(xs):`, or
+        `with self.progress(total=n) as p:` then `p.advance()` in the loop"""
+        if label is None:
+            label = f"Day {self.day_of_month} {self._stage}"
+        check = self.check_budget if self.budgeted else None
+        self._progress = Progress(iterable, total, label, self.PROGRESS, check)
+        return self._progress
+
+    def check_budget(self, progress=None):
+        """Cancels the current part, raising BudgetExceeded, if it is over budget.
+        `progress` tells how far it got (default: the last progress() loop). In hot
+        loops, check `budgeted` (copied to a local) and only call this every so often"""
+        if time.perf_counter() > self._deadline:
+            reason = f"over {self.TIME_BUDGET:g}s"
+        elif (
+            self.MEMORY_BUDGET is not None
+            and _traced_memory() - self._memory_base > self.MEMORY_BUDGET
+        ):
+            reason = f"over {format_bytes(self.MEMORY_BUDGET)}"
+        else:
+            return
+
+        raise BudgetExceeded(reason, str(progress or self._progress or ""))
+
+    @property
+    def budgeted(self) -> bool:
+        return self.TIME_BUDGET is not None or self.MEMORY_BUDGET is not None
+
+    def _start_budget(self):
+        if self.TIME_BUDGET is not None:
+            self._deadline = time.perf_counter() + self.TIME_BUDGET
+        if self.MEMORY_BUDGET is not None:
+            self._memory_base = _traced_memory()
+
+    def _timed_out(self, part: int, e: BudgetExceeded):
+        self._lap(f"part {part}")
+        self.timeouts[f"part {part}"] = str(e)
+        print(f"Result {part}: Timed out ({e})")
+
+    def _solve(self):
+        started_tracing = False
+        if self.TRACE_MEMORY_TOP or self.MEMORY_BUDGET is not None:
+            import tracemalloc
+
+            if started_tracing := not tracemalloc.is_tracing():
+                tracemalloc.start()
+
+        try:
+            # Staged solvers are profiled (and traced) stage by stage
+            if self.is_staged:
+                self.solve()
+            else:
+                try:
+                    self._run_stage("solve", self.solve)
+                except BudgetExceeded as e:
+                    self._timed_out(1 if self.result_1 is None else 2, e)
+        finally:
+            if started_tracing:
+                tracemalloc.stop()
+
+    def debug(self, *args):
+        """Traces the arguments like `print`, only formatting them if DEBUG is enabled.
+        Hot loops should check `self.tracer.isEnabledFor(logging.DEBUG)` first"""
+        if self.tracer.isEnabledFor(logging.DEBUG):
+            self.tracer.debug(" ".join(map(str, args)))
+
+    def info(self, *args):
+        if self.tracer.isEnabledFor(logging.INFO):
+            self.tracer.info(" ".join(map(str, args)))
+
+
+class DayRegistry(collections.abc.Mapping):
+    """Maps days to their `Solver` subclasses, importing `day_XX.py` on first use"""
+
+    def __init__(self, path: pathlib.Path = SOLUTIONS):
+        self.path = path
+        self._solvers = {}
+
+    @staticmethod
+    def module_name(day: int) -> str:
+        return f"day_{day:02}"
+
+    def __getitem__(self, day: int) -> type[Solver]:
+        if day in self._solvers:
+            return self._solvers[day]
+
+        candidates = self._solver_classes(day)
+        solver_cls = next((c for c in candidates if c.__name__ == "Solver"), candidates[0])
+        self._solvers[day] = solver_cls
+        return solver_cls
+
+    def engines(self, day: int) -> dict[str, type[Solver]]:
+        """The day's Solver subclasses, by their ENGINE name, the reference first"""
+        engines = {"reference": self[day]}
+        for solver_cls in self._solver_classes(day):
+            engines.setdefault(solver_cls.ENGINE, solver_cls)
+
+        return engines
+
+    def _solver_classes(self, day: int) -> list[type[Solver]]:
+        if day not in self:
+            raise KeyError(day)
+
+        module = importlib.import_module(self.module_name(day))
+
+        candidates = [
+            obj
+            for obj in vars(module).values()
+            if isinstance(obj, type)
+            and issubclass(obj, Solver)
+            and obj.__module__ == module.__name__
+        ]
+        if not candidates:
+            raise LookupError(f"No Solver found in {module.__name__}")
+
+        return candidates
+
+    def reload(self, day: int) -> type[Solver]:
+        """Re-imports `day_XX.py`, e.g. after it changed or after lib was reloaded"""
+        self._solvers.pop(day, None)
+        if (module := sys.modules.get(self.module_name(day))) is not None:
+            importlib.reload(module)
+        return self[day]
+
+    def __contains__(self, day) -> bool:
+        return (
+            isinstance(day, int)
+            and (self.path / f"{self.module_name(day)}.py").exists()
+        )
+
+    def __iter__(self):
+        return (day for day in range(1, 26) if day in self)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
+DAYS = DayRegistry()
 
 
 class Position2D:
@@ -270,9 +1535,11 @@ class DirectionWithReprEnum(enum.Enum):
         while series[0] != start:
             series.append(series.pop(0))
 
-        print("Sorted series")
-        for d in series:
-            print(d, d.value.angle, d.value.angle_diff(start))
+        tracer = TRACER.getChild("lib.direction")
+        if tracer.isEnabledFor(logging.DEBUG):
+            tracer.debug("Sorted series")
+            for d in series:
+                tracer.debug(f"{d} {d.value.angle} {d.value.angle_diff(start)}")
         if once:
             return iter(series)
 
@@ -330,11 +1597,16 @@ class Maze:
         self.register_symbol = register_symbol
         self._colours = {}
 
+        self.tracer = TRACER.getChild("lib.maze")
+        if self.DEBUG:
+            self.tracer.setLevel(logging.DEBUG)
+
     def load_from_pos_symbol_generator(
         self, pos_symbol_gen: Iterable[tuple[Position2D, Any]], ignore_symbol=None
     ):
         ignore_symbol = ignore_symbol or {}
         max_x = max_y = 0
+        tracing = self.tracer.isEnabledFor(logging.DEBUG)
 
         for pos, symbol in pos_symbol_gen:
             max_x = max(max_x, pos.x)
@@ -342,8 +1614,8 @@ class Maze:
 
             if symbol == ignore_symbol or symbol in ignore_symbol:
                 continue
-            if self.DEBUG:
-                print(pos, symbol)
+            if tracing:
+                self.tracer.debug(f"{pos} {symbol}")
             self.maze[pos] = symbol
 
             if (
@@ -361,19 +1633,25 @@ class Maze:
         self.w = max_x + 1
 
     def print(self, replace: dict[Position2D, str] = None):
+        print(self.render(replace))
+
+    def render(self, replace: dict[Position2D, str] = None) -> str:
         if not replace:
             replace = {}
 
-        print("Maze:", self.h, self.w)
+        lines = [f"Maze: {self.h} {self.w}"]
         for y in range(self.h):
+            line = []
             for x in range(self.w):
                 pos = Position2D(x, y)
 
                 if replacement := replace.get(pos, None):
-                    print(self.colour(replacement), end="")
+                    line.append(self.colour(replacement))
                 else:
-                    print(self.get_with_c(pos, "."), end="")
-            print()
+                    line.append(self.get_with_c(pos, "."))
+            lines.append("".join(line))
+
+        return "\n".join(lines)
 
     def get_with_c(self, pos: Position2D, default: str = None):
         symbol = self.maze.get(pos, default)
@@ -1,8 +1,24 @@
+import argparse
+import concurrent.futures
+import contextlib
 import datetime
+import importlib
+import math
+import os
+import pathlib
+import sys
+import time
+import traceback
+
+import colorama
 
 import create_file
 import lib
 
+# Seconds each part may take in headless runs, so that one that would not end (e.g.
+# day 11's reference part 2) does not hold up the others
+HEADLESS_TIME_BUDGET = 60.0
+
 
 def main():
     print("Hello, advent adventurer!")
@@ -27,12 +43,15 @@ def main():
 
         n_pending = 0
         for part in range(1, 3):
-            if (lib.RESULTS / f"day_{i:02}_{part}.txt").exists():
+            if lib.RESULT_STORE.get(i, part) is not None:
                 print("★", end=" ")
             else:
                 print("☆", end=" ")
                 n_pending += 1
 
+        if last_timings := lib.TIMING_HISTORY.last(i):
+            print(f"{sum(last_timings.values()):7.3f}s", end=" ")
+
         if n_pending == 0:
             print()
             continue
@@ -69,5 +88,427 @@ def main():
     print("Goodbye, advent adventurer!")
 
 
+def parse_days(spec: str) -> list[int]:
+    """Parses day specs like `1-11` or `1,3,5-7`"""
+    days = set()
+    for bit in spec.split(","):
+        first, _, last = bit.partition("-")
+        try:
+            days.update(range(int(first), int(last or first) + 1))
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"Invalid days: {spec!r}")
+
+    if not days or min(days) < 1 or max(days) > 25:
+        raise argparse.ArgumentTypeError(f"Days must be in 1-25: {spec!r}")
+
+    return sorted(days)
+
+
+def available_days() -> list[int]:
+    """Days having both a solution and an input"""
+    return [i for i in lib.DAYS if (lib.INPUTS / f"day_{i:02}.txt").exists()]
+
+
+def solve_day(
+    day: int,
+    verbose: bool = False,
+    parts=(1, 2),
+    source=None,
+    engine: str = "reference",
+    **settings,
+) -> lib.SolveReport:
+    """Solves a day, never prompting, with its output silenced. `source` replaces the
+    day's input (see lib.as_input), `engine` picks one of its engines (the reference one if it has
+    no such engine), and `settings` override the Solver class attributes (e.g.
+    MEMOIZE=False)"""
+    try:
+        with open(os.devnull, "w") as devnull:
+            with contextlib.redirect_stdout(sys.stdout if verbose else devnull):
+                engines = lib.DAYS.engines(day)
+                solver_cls = engines.get(engine, engines["reference"])
+                solver = solver_cls(day, parts=parts, source=source)
+                solver.RESULT_POLICY = lib.ResultPolicy.VERIFY
+                solver.PROGRESS = False
+                for name, value in settings.items():
+                    setattr(solver, name, value)
+                solver()
+    except Exception as e:
+        return lib.SolveReport(day, error=f"{type(e).__name__}: {e}")
+
+    return solver.report()
+
+
+def solve_days(
+    days: list[int],
+    verbose: bool = False,
+    jobs: int = 1,
+    parts=(1, 2),
+    tracing: tuple = (),
+    **settings,
+):
+    """Yields the reports as the days are solved. With several jobs, days are sent to
+    a process pool, historically slowest first, so that they do not end up last.
+    `tracing` are the arguments of lib.configure_tracing for the pool workers"""
+    if jobs == 1:
+        for day in days:
+            yield solve_day(day, verbose, parts, **settings)
+        return
+
+    def last_total(day: int) -> float:
+        last_timings = lib.TIMING_HISTORY.last(day)
+        return sum(last_timings.values()) if last_timings else math.inf
+
+    by_cost = sorted(days, key=last_total, reverse=True)
+
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=jobs, initializer=lib.configure_tracing, initargs=tracing
+    ) as pool:
+        futures = [
+            pool.submit(solve_day, day, verbose, parts, **settings) for day in by_cost
+        ]
+        for future in concurrent.futures.as_completed(futures):
+            yield future.result()
+
+
+def print_report(report: lib.SolveReport):
+    if report.error is not None:
+        print(f"{report.day:3} {report.error}")
+        return
+
+    print(
+        f"{report.day:3}",
+        *(
+            f"{t:8.3f}s" if (t := report.timings.get(stage)) is not None else f"{'-':>9}"
+            for stage in lib.Solver.STAGES
+        ),
+        f"{report.total:8.3f}s ",
+        *report.stars,
+        "(memoized)" if report.memoized else "",
+    )
+
+    for stage, timeout in report.timeouts.items():
+        print(f"{'':3} {stage:>9} timed out: {timeout}")
+
+    for metric, value in report.metrics.items():
+        print(f"{'':3} {metric:<32} {value:>12}")
+
+    for stage, peak in report.memory.items():
+        print(f"{'':3} {stage:>9} peak {lib.format_bytes(peak)}")
+        for allocation in report.allocations.get(stage, []):
+            print(f"{'':3} {'':>9} {allocation}")
+
+
+def check_report(
+    report: lib.SolveReport, policy: lib.ResultPolicy, store: lib.ResultStore
+) -> list[str]:
+    """Applies the result policy to a report, updating its stars. Returns the mismatches"""
+    if report.error is not None:
+        return []
+
+    mismatches = []
+    stars = []
+    for part, result in enumerate((report.result_1, report.result_2), 1):
+        try:
+            stars.append(store.check(report.day, part, result, policy))
+        except RuntimeError as e:
+            stars.append("✗")
+            mismatches.append(str(e))
+
+    report.stars = tuple(stars)
+    return mismatches
+
+
+def batch(
+    days: list[int],
+    verbose: bool = False,
+    jobs: int = 1,
+    policy: lib.ResultPolicy = lib.ResultPolicy.VERIFY,
+    parts=(1, 2),
+    compare: float | None = None,
+    tracing: tuple = (),
+    **settings,
+) -> bool:
+    """Solves the days, with the results checked (and stored) by this process only.
+    The timings are added to the history, after being compared with it if `compare`
+    is given. Returns False if any result did not match under the `fail` policy, or
+    if any stage got slower than `compare` (e.g. 0.2 for 20%). Parts cancelled by
+    their budget are only reported. Results and timings of other inputs than the
+    days' own (a `source` in `settings`) are neither checked nor recorded"""
+    print(f"{'Day':>3} {'Parse':>9} {'Part 1':>9} {'Part 2':>9} {'Total':>9}  Stars")
+
+    own_inputs = settings.get("source") is None
+
+    t0 = time.perf_counter()
+    reports = []
+    mismatches = []
+    for report in solve_days(days, verbose, jobs, parts, tracing, **settings):
+        if own_inputs:
+            mismatches += check_report(report, policy, lib.RESULT_STORE)
+        reports.append(report)
+        if jobs == 1:
+            print_report(report)
+
+    if jobs > 1:
+        reports.sort(key=lambda r: r.day)
+        for report in reports:
+            print_report(report)
+
+    print(f"{'All':>3} {'':>29} {sum(r.total for r in reports):8.3f}s")
+    print(f"Wall-clock time: {time.perf_counter() - t0:.3f}s ({jobs} jobs)")
+
+    regressions = []
+    for report in reports if own_inputs else ():
+        # Cancelled or resumed parts would look like speedups (or slowdowns) in the
+        # history
+        if report.error is not None or report.memoized:
+            continue
+        if report.timeouts or report.resumed:
+            continue
+        if compare is not None:
+            regressions += lib.TIMING_HISTORY.regressions(
+                report.day, report.timings, compare
+            )
+        lib.TIMING_HISTORY.append(report.day, report.timings)
+
+    lib.RESULT_STORE.flush()
+
+    for report in reports:
+        for stage, timeout in report.timeouts.items():
+            print(f"Timed out: day {report.day} {stage} ({timeout})")
+    for mismatch in mismatches:
+        print(mismatch)
+    for regression in regressions:
+        print("Slower:", regression)
+
+    return not mismatches and not regressions
+
+
+def watch(
+    day: int,
+    verbose: bool = False,
+    parts=(1, 2),
+    tracing: tuple = (),
+    interval: float = 0.2,
+    **settings,
+):
+    """Solves the day again whenever its solver, lib.py or its input change, in this
+    same process: only the changed modules are re-imported, and the parsed inputs are
+    kept in memory until lib.py changes. Runs until interrupted"""
+    day_file = lib.SOLUTIONS / f"{lib.DAYS.module_name(day)}.py"
+    lib_file = pathlib.Path(lib.__file__)
+    files = (day_file, lib_file, lib.INPUTS / f"day_{day:02}.txt")
+
+    def mtimes() -> dict[pathlib.Path, int | None]:
+        return {f: f.stat().st_mtime_ns if f.exists() else None for f in files}
+
+    lib.PARSE_CACHE.in_memory = True
+    seen = mtimes()
+    to_reload = set()
+
+    print(f"Watching {', '.join(map(str, files))} (Ctrl-C to stop)")
+    print(f"{'Day':>3} {'Parse':>9} {'Part 1':>9} {'Part 2':>9} {'Total':>9}  Stars")
+    while True:
+        t0 = time.perf_counter()
+        try:
+            if lib_file in to_reload:
+                colorama.deinit()  # lib wraps stdout and stderr again when re-imported
+                importlib.reload(lib)
+                lib.configure_tracing(*tracing)
+                lib.PARSE_CACHE.in_memory = True
+            if to_reload:  # Also after lib, for the day to subclass the new lib.Solver
+                lib.DAYS.reload(day)
+        except Exception:
+            traceback.print_exc()
+        else:
+            to_reload.clear()
+            print_report(solve_day(day, verbose, parts, **settings))
+            print(f"{'':3} turnaround {time.perf_counter() - t0:.3f}s")
+
+        while (current := mtimes()) == seen:
+            time.sleep(interval)
+
+        to_reload |= {f for f in (day_file, lib_file) if current[f] != seen[f]}
+        seen = current
+
+
+def cli():
+    parser = argparse.ArgumentParser(description="AoC 2024 solutions")
+    which = parser.add_mutually_exclusive_group()
+    which.add_argument(
+        "--all", action="store_true", help="Solve every available day, headless"
+    )
+    which.add_argument(
+        "--days", type=parse_days, help="Solve the given days (e.g. 1-11), headless"
+    )
+    which.add_argument(
+        "--watch",
+        type=int,
+        metavar="DAY",
+        help="Solve DAY again whenever its code or input change, in a warm process",
+    )
+    parser.add_argument(
+        "-v", "--verbose", action="store_true", help="Do not silence the solvers"
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Solve the days in a pool of JOBS processes (0: one per CPU)",
+    )
+    parser.add_argument(
+        "--policy",
+        type=lib.ResultPolicy,
+        choices=[p for p in lib.ResultPolicy if p != lib.ResultPolicy.ASK],
+        default=lib.ResultPolicy.VERIFY,
+        help="What to do with new or mismatching results (default: verify)",
+    )
+    parser.add_argument(
+        "--no-memo",
+        dest="memoize",
+        action="store_false",
+        help="Solve even if there are memoized results for the same input and code",
+    )
+    parser.add_argument(
+        "--part",
+        type=int,
+        choices=(1, 2),
+        help="Only solve this part (for solvers split in parse/part_1/part_2 stages)",
+    )
+    parser.add_argument(
+        "--compare",
+        type=float,
+        metavar="PCT",
+        help="Fail if any stage is more than PCT%% slower than in the previous runs",
+    )
+    parser.add_argument(
+        "--engine",
+        default="reference",
+        help="Solve with this engine (days without it use their reference engine)",
+    )
+    parser.add_argument(
+        "--input",
+        metavar="PATH",
+        help="Solve this input (- for stdin) instead of the day's, for a single day",
+    )
+    parser.add_argument(
+        "--profile",
+        type=int,
+        nargs="?",
+        const=20,
+        metavar="N",
+        help="Profile each stage, printing its top N entries (default: 20) to stderr",
+    )
+    parser.add_argument(
+        "--memory",
+        type=int,
+        nargs="?",
+        const=5,
+        metavar="N",
+        help="Trace the peak memory of each stage and its top N allocation sites",
+    )
+    parser.add_argument(
+        "--metrics",
+        action="store_true",
+        help="Collect the solvers' counters (nodes expanded, queue lengths...)",
+    )
+    parser.add_argument(
+        "--time-budget",
+        type=float,
+        metavar="SECONDS",
+        help="Cancel any part taking longer than this, reporting it as timed out "
+        f"(default: {HEADLESS_TIME_BUDGET:g} when solving headless, 0: no budget)",
+    )
+    parser.add_argument(
+        "--memory-budget",
+        type=float,
+        metavar="MIB",
+        help="Cancel any part allocating more than this (traced, so slower)",
+    )
+    parser.add_argument(
+        "--no-checkpoints",
+        dest="checkpoints",
+        action="store_false",
+        help="Neither resume long solves from their checkpoints nor save new ones",
+    )
+    parser.add_argument(
+        "--trace",
+        metavar="SPEC",
+        help="Trace levels, like WARNING,day_06=DEBUG,lib.maze=DEBUG "
+        "(default: INFO, or WARNING when solving headless without --verbose)",
+    )
+    parser.add_argument(
+        "--trace-file", metavar="PATH", help="Write the traces to PATH, not stderr"
+    )
+    parser.add_argument(
+        "--trace-ring",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Only keep the last N traces in memory, printed to stderr at the end",
+    )
+    args = parser.parse_args()
+
+    if args.watch is not None and args.watch not in lib.DAYS:
+        parser.error(f"No solver for day {args.watch}")
+
+    jobs = args.jobs or os.cpu_count()
+
+    headless = args.all or args.days or args.watch
+    levels = args.trace or ("WARNING" if headless and not args.verbose else "INFO")
+    tracing = (levels, args.trace_file, args.trace_ring)
+    trace_handler = lib.configure_tracing(*tracing)
+    if args.trace_ring:  # Each worker would keep (and lose) its own ring
+        jobs = 1
+
+    settings = {"MEMOIZE": args.memoize, "engine": args.engine}
+    if args.profile:
+        # Nothing to profile in memoized results, and workers would mix their output
+        settings |= {"MEMOIZE": False, "PROFILE_TOP": args.profile}
+        jobs = 1
+    if args.memory:
+        settings |= {"MEMOIZE": False, "TRACE_MEMORY_TOP": args.memory}
+    if args.metrics:
+        settings |= {"MEMOIZE": False, "METRICS": True}
+    if args.time_budget is None and headless:
+        args.time_budget = HEADLESS_TIME_BUDGET
+    if args.time_budget:
+        settings["TIME_BUDGET"] = args.time_budget
+    if args.memory_budget is not None:
+        settings["MEMORY_BUDGET"] = int(args.memory_budget * 2**20)
+    if not args.checkpoints:
+        settings["CHECKPOINT_INTERVAL"] = None
+    if args.input is not None:
+        if not args.days or len(args.days) != 1:
+            parser.error("--input needs a single day in --days")
+        # Streams are read here: they could not be sent to pool workers
+        if args.input == "-":
+            settings["source"] = sys.stdin.buffer.read()
+        else:
+            settings["source"] = pathlib.Path(args.input)
+
+    parts = (args.part,) if args.part else (1, 2)
+    if args.watch:
+        settings["MEMOIZE"] = False  # Timings are the point
+        try:
+            watch(args.watch, args.verbose, parts, tracing, **settings)
+        except KeyboardInterrupt:
+            print()
+    elif headless:
+        days = available_days() if args.all else args.days
+        compare = args.compare / 100 if args.compare is not None else None
+        ok = batch(
+            days, args.verbose, jobs, args.policy, parts, compare, tracing, **settings
+        )
+        if args.trace_ring:
+            trace_handler.dump()
+        if not ok:
+            sys.exit(1)
+    else:
+        main()
+        if args.trace_ring:
+            trace_handler.dump()
+
+
 if __name__ == "__main__":
-    main()
+    cli()
@@ -0,0 +1,144 @@
+""" Local HTTP service solving inputs with warm solvers: each worker of its process pool
+is started up front, with `lib` and every day already imported.
+
+    POST /solve/DAY[?parts=1,2]  (the input as the request body): results and timings
+    GET /days: the days that can be solved
+
+Responses are JSON. Nothing leaves the machine: it listens on localhost by default.
+"""
+
+import argparse
+import concurrent.futures
+import http
+import http.server
+import json
+import os
+import urllib.parse
+
+import lib
+import run
+
+# Fields of lib.SolveReport sent back (stars only make sense for the stored input)
+REPORT_FIELDS = (
+    "day", "result_1", "result_2", "timings", "timeouts", "memoized", "error"
+)
+
+
+def warm_up(levels: str = "WARNING"):
+    """Pool worker initializer: imports every day up front"""
+    lib.configure_tracing(levels)
+    for day in lib.DAYS:
+        lib.DAYS[day]
+
+
+def solve(day: int, data: bytes, parts=(1, 2), **settings) -> dict:
+    """Solves an input given as bytes (see run.solve_day)"""
+    report = run.solve_day(day, False, parts, data, **settings)
+    return {field: getattr(report, field) for field in REPORT_FIELDS}
+
+
+class SolveServer(http.server.ThreadingHTTPServer):
+    def __init__(self, address, pool: concurrent.futures.Executor, **settings):
+        super().__init__(address, SolveHandler)
+        self.pool = pool
+        self.settings = settings
+
+
+class SolveHandler(http.server.BaseHTTPRequestHandler):
+    server: SolveServer
+
+    def do_GET(self):
+        if self.path != "/days":
+            self._reply(http.HTTPStatus.NOT_FOUND, {"error": f"No {self.path}"})
+            return
+
+        self._reply(http.HTTPStatus.OK, list(lib.DAYS))
+
+    def do_POST(self):
+        url = urllib.parse.urlsplit(self.path)
+        if not url.path.startswith("/solve/"):
+            self._reply(http.HTTPStatus.NOT_FOUND, {"error": f"No {url.path}"})
+            return
+
+        query = urllib.parse.parse_qs(url.query)
+        try:
+            day = int(url.path.removeprefix("/solve/"))
+            parts = tuple(
+                int(part) for part in query.get("parts", ["1,2"])[0].split(",")
+            )
+        except ValueError:
+            error = {"error": f"Invalid {self.path}"}
+            self._reply(http.HTTPStatus.BAD_REQUEST, error)
+            return
+
+        if not set(parts) <= {1, 2}:
+            error = {"error": f"Parts can only be 1 and 2: {parts}"}
+            self._reply(http.HTTPStatus.BAD_REQUEST, error)
+            return
+
+        if day not in lib.DAYS:
+            error = {"error": f"No solver for day {day}"}
+            self._reply(http.HTTPStatus.NOT_FOUND, error)
+            return
+
+        data = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        settings = self.server.settings
+        future = self.server.pool.submit(solve, day, data, parts, **settings)
+        self._reply(http.HTTPStatus.OK, future.result())
+
+    def _reply(self, status: http.HTTPStatus, body):
+        payload = json.dumps(body, default=str).encode()
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        lib.TRACER.getChild("serve").info(format, *args)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the AoC 2024 solvers locally")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8024)
+    parser.add_argument(
+        "-j", "--jobs", type=int, default=0, help="Worker processes (0: one per CPU)"
+    )
+    parser.add_argument(
+        "--no-memo",
+        dest="memoize",
+        action="store_false",
+        help="Solve even if there are memoized results for the same input and code",
+    )
+    parser.add_argument(
+        "--time-budget",
+        type=float,
+        metavar="SECONDS",
+        help="Cancel any part taking longer than this, reporting it as timed out",
+    )
+    args = parser.parse_args()
+
+    # Responses only depend on the request: nothing is resumed from a previous one
+    settings = {"MEMOIZE": args.memoize, "CHECKPOINT_INTERVAL": None}
+    if args.time_budget is not None:
+        settings["TIME_BUDGET"] = args.time_budget
+
+    jobs = args.jobs or os.cpu_count()
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=jobs, initializer=warm_up
+    ) as pool:
+        # Workers only start with the first tasks: start them all now
+        concurrent.futures.wait([pool.submit(int) for _ in range(jobs)])
+
+        with SolveServer((args.host, args.port), pool, **settings) as server:
+            print(f"Serving on http://{args.host}:{args.port} ({jobs} workers)")
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                pass
+
+
+if __name__ == "__main__":
+    main()
@@ -11,11 +11,18 @@ class Solver(lib.Solver):
     """https://adventofcode.com/2024/day/XX-DAY-XX"""
 
     @override
-    def solve(self) -> None:
+    def parse(self):
+        return self.read()
 
-        self.resolved(result_1=None)
-        self.resolved(result_2=None)
+    @override
+    def part_1(self, parsed):
+        return None
+
+    @override
+    def part_2(self, parsed):
+        return None
 
 
-solver = Solver(DAY)
-solver()
+if __name__ == "__main__":
+    solver = Solver(DAY)
+    solver()